@@ -0,0 +1,159 @@
+from collections import defaultdict
+
+# =========================================================
+# BusOrdenes: cola de órdenes de los capitanes, despachada por pasos
+# - enviar() es O(1): cada prioridad tiene su diccionario
+#   (plataforma, orden) -> argumentos.
+# - Las órdenes se agrupan dentro de un mismo paso: de "navegar" y
+#   "sumergirse" solo vale la última; "disparar" y "helicoptero" se
+#   acumulan (tres órdenes de disparar = tres disparos). Si la misma
+#   orden llega con otra prioridad, se pasa entera al nuevo nivel.
+# - despachar() se llama una vez por paso de simulación: ejecuta las
+#   órdenes pendientes de mayor a menor prioridad (0 = la más urgente)
+#   y deja las que lleguen mientras tanto para el paso siguiente.
+# - Una orden que la plataforma no sabe cumplir (sumergir una fragata)
+#   se apunta en errores y no se ejecuta; cualquier otra excepción de
+#   la plataforma sale hacia arriba.
+# - Nada de print ni de I/O al encolar.
+# =========================================================
+NAVEGAR, DISPARAR, SUMERGIRSE, HELICOPTERO = "navegar", "disparar", "sumergirse", "helicoptero"
+
+PRIORIDAD = {DISPARAR: 0, SUMERGIRSE: 1, NAVEGAR: 2, HELICOPTERO: 3}
+ACUMULABLES = (DISPARAR, HELICOPTERO)
+
+
+def ejecutar_navegar(plataforma, rumbo, velocidad):
+    plataforma.Navegar(rumbo, velocidad)
+
+
+def ejecutar_sumergirse(plataforma, profundidad):
+    plataforma.sumergirse(profundidad)
+
+
+def ejecutar_disparar(plataforma, veces):
+    for _ in range(veces):
+        plataforma.atacar()
+
+
+def ejecutar_helicoptero(plataforma, veces):
+    for _ in range(veces):
+        plataforma.despegarHelicoptero()
+
+
+EJECUTORES = {
+    NAVEGAR: ejecutar_navegar,
+    SUMERGIRSE: ejecutar_sumergirse,
+    DISPARAR: ejecutar_disparar,
+    HELICOPTERO: ejecutar_helicoptero,
+}
+
+# Método que tiene que tener la plataforma para cumplir cada orden
+CAPACIDAD = {
+    NAVEGAR: "Navegar",
+    SUMERGIRSE: "sumergirse",
+    DISPARAR: "atacar",
+    HELICOPTERO: "despegarHelicoptero",
+}
+
+
+class BusOrdenes:
+    def __init__(self, niveles=4):
+        self.niveles = niveles
+        self.pendientes = [{} for _ in range(niveles)]
+        self.nivel = {}             # (plataforma, orden) -> prioridad en la que está pendiente
+        self.recibidas = 0
+        self.ejecutadas = 0
+        self.errores = []           # (plataforma, orden, AttributeError) del último despacho
+
+    def enviar(self, plataforma, orden, *args, prioridad=None):
+        if prioridad is None:
+            prioridad = PRIORIDAD.get(orden)
+            if prioridad is None:
+                raise ValueError(f"Orden desconocida: {orden}")
+        elif orden not in EJECUTORES:
+            raise ValueError(f"Orden desconocida: {orden}")
+        elif not 0 <= prioridad < self.niveles:
+            prioridad = min(max(prioridad, 0), self.niveles - 1)
+
+        cola = self.pendientes[prioridad]
+        clave = (plataforma, orden)
+        anterior = self.nivel.get(clave, prioridad)
+        if anterior != prioridad:
+            cola[clave] = self.pendientes[anterior].pop(clave)
+        self.nivel[clave] = prioridad
+        if orden in ACUMULABLES:
+            cola[clave] = cola.get(clave, 0) + (args[0] if args else 1)
+        else:
+            cola[clave] = args
+        self.recibidas += 1
+
+    def __len__(self):
+        return sum(len(cola) for cola in self.pendientes)
+
+    def despachar(self):
+        # Lo que llegue durante el despacho (p. ej. órdenes dadas al
+        # reaccionar a otra) ya va a las colas nuevas: siguiente paso
+        colas = self.pendientes
+        self.pendientes = [{} for _ in range(self.niveles)]
+        self.nivel = {}
+        self.errores = []
+
+        ejecutadas = 0
+        for cola in colas:
+            for (plataforma, orden), args in cola.items():
+                if not hasattr(plataforma, CAPACIDAD[orden]):
+                    # Orden que esta plataforma no puede cumplir (p. ej. sumergir una fragata)
+                    error = AttributeError(f"{type(plataforma).__name__} no tiene {CAPACIDAD[orden]}()")
+                    self.errores.append((plataforma, orden, error))
+                    continue
+                if orden in ACUMULABLES:
+                    EJECUTORES[orden](plataforma, args)
+                else:
+                    EJECUTORES[orden](plataforma, *args)
+                ejecutadas += 1
+        self.ejecutadas += ejecutadas
+        return ejecutadas
+
+    def resumen_errores(self):
+        cuenta = defaultdict(int)
+        for _, orden, e in self.errores:
+            cuenta[(orden, type(e).__name__)] += 1
+        return dict(cuenta)
+
+
+# Prueba: 5.000 capitanes dando órdenes durante 100 pasos
+if __name__ == "__main__":
+    import sys
+    import time
+    import random
+    from capitan import Capitan
+    from submarino import Submarino
+
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    bus = BusOrdenes()
+    capitanes = []
+    for i in range(n):
+        capitan = Capitan(f"Capitán {i}", "Capitán de fragata", 10, bus)
+        capitan.asumirMando(Submarino(f"S{i}", "España", 80, 3000, 20, 300, "AIP", 18))
+        capitanes.append(capitan)
+
+    random.seed(0)
+    rumbos = [random.randint(1, 359) for _ in range(n)]
+    profundidades = [random.randint(0, 300) for _ in range(n)]
+    t_enviar = t_despachar = 0.0
+    for paso in range(100):
+        inicio = time.perf_counter()
+        for capitan, rumbo, profundidad in zip(capitanes, rumbos, profundidades):
+            # Varias órdenes por paso: solo la última de cada tipo llega a ejecutarse
+            for velocidad in (5, 10, 15, 20):
+                capitan.DarOrden(NAVEGAR, rumbo, velocidad)
+            capitan.DarOrden(SUMERGIRSE, profundidad)
+        t_enviar += time.perf_counter() - inicio
+
+        inicio = time.perf_counter()
+        bus.despachar()
+        t_despachar += time.perf_counter() - inicio
+
+    print(f"{n} capitanes x 100 pasos | órdenes recibidas {bus.recibidas} | ejecutadas {bus.ejecutadas}")
+    print(f"encolar: {t_enviar / bus.recibidas * 1e9:.0f} ns/orden | "
+          f"despachar: {t_despachar / 100 * 1000:.2f} ms/paso")
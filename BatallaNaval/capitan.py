@@ -1,19 +1,45 @@
 from plataformanaval import PlataformaNaval
 class Capitan ():
-    def __init__(self, nombre, rango, añosexperiencia):
+    def __init__(self, nombre, rango, añosexperiencia, bus=None):
         self.nombre = nombre
         self.rango = rango
         self.añosexperiencia = añosexperiencia
-    
+        self.bus = bus              # BusOrdenes donde se encolan sus órdenes
+        self.orden = None
+        self.plataforma = None      # la última de la que ha asumido el mando
+        self.plataformas = []
+
     def __str__(self):
         return (f"Nombre del Capitán: {self.nombre}\n"
                 f"Rango del Capitán: {self.rango}\n"
                 f"Años de Experiencia: {self.añosexperiencia}")
-    
-    def DarOrden (self, orden: str):
+
+    def DarOrden (self, orden: str, *args, plataforma=None, prioridad=None):
+        # Sin plataforma: a todas las que manda. Se ejecuta en el siguiente bus.despachar()
         self.orden = orden
-    
+        if self.bus is None:
+            return
+        destinos = self.plataformas if plataforma is None else (plataforma,)
+        for p in destinos:
+            self.bus.enviar(p, orden, *args, prioridad=prioridad)
+
     def asumirMando(self, plataforma):
+        # Una plataforma tiene un solo capitán: si ya tenía otro, deja de mandarla
         self.plataforma = plataforma
-        
-    
\ No newline at end of file
+        if plataforma in self.plataformas:
+            return
+        if isinstance(plataforma, PlataformaNaval):
+            anterior = plataforma.capitan
+            if anterior is not None and anterior is not self:
+                anterior.cederMando(plataforma)
+            plataforma.capitan = self
+        self.plataformas.append(plataforma)
+
+    def cederMando(self, plataforma):
+        if getattr(plataforma, "capitan", None) is self:
+            plataforma.capitan = None
+        if plataforma in self.plataformas:
+            self.plataformas.remove(plataforma)
+        if self.plataforma is plataforma:
+            self.plataforma = self.plataformas[-1] if self.plataformas else None
+
@@ -0,0 +1,271 @@
+import time
+import numpy as np
+from fragata import Fragata
+from corbeta import Corbeta
+from submarino import Submarino
+
+# =========================================================
+# MotorCombate: enfrentamiento entre flotas por pasos de tiempo
+# - Todas las plataformas de todas las flotas van en arrays de NumPy
+#   (bando, tipo, posición, daño y munición); cada paso se resuelve con
+#   operaciones sobre los arrays, sin una llamada por plataforma.
+# - Corbeta: misiles antibuque contra barcos de superficie.
+# - Submarino: torpedos contra cualquier barco (incluidos submarinos).
+# - Fragata: sus misiles antiaéreos derriban misiles antibuque que van
+#   contra barcos de su bando que tenga cerca.
+# - Cada plataforma va hacia el enemigo más cercano hasta tenerlo a
+#   tiro; solo se busca objetivo nuevo cuando el anterior se hunde.
+# - Al acabar se vuelcan munición y daño a los objetos (recibirdaño).
+# =========================================================
+FRAGATA, CORBETA, SUBMARINO, OTRA = 0, 1, 2, 3
+
+# Alcance (km), daño y probabilidad de acierto por arma
+ALCANCE_ANTIBUQUE, DANIO_ANTIBUQUE, ACIERTO_ANTIBUQUE = 150.0, 60.0, 0.7
+ALCANCE_TORPEDO, DANIO_TORPEDO, ACIERTO_TORPEDO = 20.0, 90.0, 0.6
+ALCANCE_ANTIAEREO, ACIERTO_ANTIAEREO = 30.0, 0.5
+
+VIDA = 100.0            # daño con el que una plataforma se hunde
+MINUTOS_POR_PASO = 1
+KM_POR_NUDO = 1.852 / 60 * MINUTOS_POR_PASO
+
+
+def tipo_de(plataforma):
+    if isinstance(plataforma, Fragata):
+        return FRAGATA
+    if isinstance(plataforma, Corbeta):
+        return CORBETA
+    if isinstance(plataforma, Submarino):
+        return SUBMARINO
+    return OTRA
+
+
+def mas_cercano(ox, oy, dx, dy, bloque=1024):
+    # Para cada origen: índice del destino más cercano y distancia.
+    # Por bloques para no crear una matriz de n x m entera.
+    indice = np.full(len(ox), -1, dtype=np.int64)
+    distancia = np.full(len(ox), np.inf)
+    if len(dx) == 0:
+        return indice, distancia
+    for i in range(0, len(ox), bloque):
+        d2 = (ox[i:i + bloque, None] - dx[None, :]) ** 2 + (oy[i:i + bloque, None] - dy[None, :]) ** 2
+        j = d2.argmin(axis=1)
+        indice[i:i + bloque] = j
+        distancia[i:i + bloque] = np.sqrt(d2[np.arange(len(j)), j])
+    return indice, distancia
+
+
+class MotorCombate:
+    def __init__(self, flotas, separacion_km=200.0, frente_km=500.0, semilla=None):
+        self.flotas = list(flotas)
+        self.rng = np.random.default_rng(semilla)
+
+        self.plataformas = []
+        bandos = []
+        for b, flota in enumerate(self.flotas):
+            self.plataformas += flota.plataformas
+            bandos += [b] * len(flota.plataformas)
+        p = self.plataformas
+        n = len(p)
+
+        self.bando = np.array(bandos, dtype=np.int64)
+        self.tipo = np.array([tipo_de(x) for x in p], dtype=np.int64)
+        self.antibuque = np.array([getattr(x, "misilesAntibuque", 0) for x in p], dtype=np.int64)
+        self.torpedos = np.array([getattr(x, "tubosLanzatorpedos", 0) for x in p], dtype=np.int64)
+        self.antiaereos = np.array([getattr(x, "misilesAntiaereos", 0) for x in p], dtype=np.int64)
+        self.danio = np.array([getattr(x, "puntos", 0) for x in p], dtype=np.float64)
+        self.avance = np.array([x.velocidadMaxima for x in p], dtype=np.float64) * KM_POR_NUDO
+
+        # Cada flota en formación a lo largo del frente, separadas entre sí
+        self.x = self.bando * separacion_km + self.rng.uniform(-5, 5, n)
+        self.y = self.rng.uniform(0, frente_km, n)
+
+        # Hasta dónde se acerca cada una a su objetivo
+        self.alcance = np.select([self.tipo == CORBETA, self.tipo == SUBMARINO, self.tipo == FRAGATA],
+                                 [ALCANCE_ANTIBUQUE, ALCANCE_TORPEDO, ALCANCE_ANTIAEREO], 0.0)
+        self.objetivo = np.full(n, -1, dtype=np.int64)
+
+        self.pasos = 0
+        self.disparos = 0
+        self.impactos = 0
+        self.derribos = 0
+
+    def vivos(self):
+        return self.danio < VIDA
+
+    # -----------------------------
+    # Un paso de simulación
+    # -----------------------------
+    def paso(self):
+        vivos = self.vivos()
+        self.buscar_objetivos(vivos)
+
+        t = self.objetivo
+        con_objetivo = vivos & (t >= 0)
+        tc = np.where(con_objetivo, t, 0)
+        dx = self.x[tc] - self.x
+        dy = self.y[tc] - self.y
+        dist = np.hypot(dx, dy)
+
+        # Movimiento: acercarse hasta el 90 % del alcance del arma
+        falta = np.where(con_objetivo, dist - self.alcance * 0.9, 0.0)
+        mover = np.clip(np.minimum(self.avance, falta), 0.0, None)
+        factor = np.divide(mover, dist, out=np.zeros_like(dist), where=dist > 0)
+        self.x += dx * factor
+        self.y += dy * factor
+        dist -= mover
+
+        # Disparos (simultáneos: el que se hunde en este paso también dispara)
+        a_tiro = con_objetivo & (dist <= self.alcance)
+        misiles = np.flatnonzero(a_tiro & (self.tipo == CORBETA) & (self.antibuque > 0))
+        self.antibuque[misiles] -= 1
+        self.impactar(t[misiles], ACIERTO_ANTIBUQUE, DANIO_ANTIBUQUE, self.interceptar(t[misiles], vivos))
+
+        torpedos = np.flatnonzero(a_tiro & (self.tipo == SUBMARINO) & (self.torpedos > 0))
+        self.torpedos[torpedos] -= 1
+        self.impactar(t[torpedos], ACIERTO_TORPEDO, DANIO_TORPEDO)
+
+        self.disparos += len(misiles) + len(torpedos)
+        self.pasos += 1
+
+    def buscar_objetivos(self, vivos):
+        # Solo los que no tienen objetivo o cuyo objetivo se ha hundido
+        t = self.objetivo
+        buscan = vivos & ((t < 0) | ~vivos[np.where(t >= 0, t, 0)])
+        self.objetivo[~vivos] = -1
+        if not buscan.any():
+            return
+
+        for b in np.unique(self.bando[buscan]):
+            enemigos = vivos & (self.bando != b)
+            # Los misiles antibuque (y las fragatas) no ven submarinos
+            for solo_superficie in (True, False):
+                filas = buscan & (self.bando == b) & ((self.tipo != SUBMARINO) == solo_superficie)
+                filas = np.flatnonzero(filas)
+                if len(filas) == 0:
+                    continue
+                candidatos = np.flatnonzero(enemigos & (self.tipo != SUBMARINO) if solo_superficie else enemigos)
+                if len(candidatos) == 0:
+                    self.objetivo[filas] = -1
+                    continue
+                j, _ = mas_cercano(self.x[filas], self.y[filas], self.x[candidatos], self.y[candidatos])
+                self.objetivo[filas] = candidatos[j]
+
+    def interceptar(self, objetivos, vivos):
+        # Para cada misil: ¿lo derriba la fragata más cercana a su objetivo?
+        derribado = np.zeros(len(objetivos), dtype=bool)
+        if len(objetivos) == 0:
+            return derribado
+
+        defensor = np.full(len(objetivos), -1, dtype=np.int64)
+        for b in np.unique(self.bando[objetivos]):
+            misiles = np.flatnonzero(self.bando[objetivos] == b)
+            fragatas = np.flatnonzero(vivos & (self.bando == b) & (self.tipo == FRAGATA) & (self.antiaereos > 0))
+            j, d = mas_cercano(self.x[objetivos[misiles]], self.y[objetivos[misiles]], self.x[fragatas], self.y[fragatas])
+            cerca = (j >= 0) & (d <= ALCANCE_ANTIAEREO)
+            defensor[misiles[cerca]] = fragatas[j[cerca]]
+
+        # Cada fragata dispara como mucho los misiles antiaéreos que le quedan
+        con_defensa = np.flatnonzero(defensor >= 0)
+        orden = con_defensa[np.argsort(defensor[con_defensa], kind="stable")]
+        d = defensor[orden]
+        if len(d) == 0:
+            return derribado
+        inicio = np.flatnonzero(np.r_[True, d[1:] != d[:-1]])
+        puesto = np.arange(len(d)) - np.repeat(inicio, np.diff(np.r_[inicio, len(d)]))
+        disparan = puesto < self.antiaereos[d]
+        np.subtract.at(self.antiaereos, d[disparan], 1)
+
+        derribado[orden[disparan]] = self.rng.random(disparan.sum()) < ACIERTO_ANTIAEREO
+        self.derribos += int(derribado.sum())
+        return derribado
+
+    def impactar(self, objetivos, acierto, danio, derribado=None):
+        aciertos = self.rng.random(len(objetivos)) < acierto
+        if derribado is not None:
+            aciertos &= ~derribado
+        np.add.at(self.danio, objetivos[aciertos], danio)
+        self.impactos += int(aciertos.sum())
+
+    # -----------------------------
+    # Bucle completo
+    # -----------------------------
+    def terminado(self):
+        vivos = self.vivos()
+        if len(np.unique(self.bando[vivos])) < 2:
+            return True
+        # Se acaba cuando ningún bando tiene con qué dar a lo que le queda
+        # enfrente: corbetas con misiles contra barcos de superficie,
+        # submarinos con torpedos contra cualquiera
+        superficie = vivos & (self.tipo != SUBMARINO)
+        for b in np.unique(self.bando[vivos]):
+            propios = vivos & (self.bando == b)
+            enemigos = vivos & (self.bando != b)
+            if (propios & (self.tipo == SUBMARINO) & (self.torpedos > 0)).any() and enemigos.any():
+                return False
+            if ((propios & (self.tipo == CORBETA) & (self.antibuque > 0)).any() and
+                    (superficie & enemigos).any()):
+                return False
+        return True
+
+    def ejecutar(self, max_pasos=10000):
+        inicio = time.perf_counter()
+        while self.pasos < max_pasos and not self.terminado():
+            self.paso()
+        segundos = time.perf_counter() - inicio
+        self.volcar()
+        return self.resumen(segundos)
+
+    def volcar(self):
+        # El estado final vuelve a los objetos de cada flota
+        for i, p in enumerate(self.plataformas):
+            if self.tipo[i] == CORBETA:
+                p.misilesAntibuque = int(self.antibuque[i])
+            elif self.tipo[i] == SUBMARINO:
+                p.tubosLanzatorpedos = int(self.torpedos[i])
+            elif self.tipo[i] == FRAGATA:
+                p.misilesAntiaereos = int(self.antiaereos[i])
+            p.recibirdaño(int(min(self.danio[i], VIDA)))
+            p.hundida = bool(self.danio[i] >= VIDA)
+
+    def resumen(self, segundos=0.0):
+        vivos = self.vivos()
+        return {
+            "pasos": self.pasos,
+            "minutos": self.pasos * MINUTOS_POR_PASO,
+            "segundos": segundos,
+            "disparos": self.disparos,
+            "impactos": self.impactos,
+            "derribos": self.derribos,
+            "supervivientes": {f.nombre: int((vivos & (self.bando == b)).sum()) for b, f in enumerate(self.flotas)},
+        }
+
+
+# Prueba: dos flotas de 2.500 plataformas cada una
+if __name__ == "__main__":
+    import sys
+    import random
+    from flota import Flota
+
+    por_flota = int(sys.argv[1]) if len(sys.argv) > 1 else 2500
+    random.seed(0)
+
+    def crear_flota(nombre, zona):
+        flota = Flota(nombre, zona)
+        for i in range(por_flota):
+            tipo = i % 3
+            if tipo == 0:
+                p = Fragata(f"{nombre} F{i}", "España", 140, 5800, random.randint(25, 30), 32, 1, "Escolta")
+            elif tipo == 1:
+                p = Corbeta(f"{nombre} C{i}", "España", 90, 2500, random.randint(25, 30), 8, 20)
+            else:
+                p = Submarino(f"{nombre} S{i}", "España", 80, 3000, random.randint(18, 22), 300, "AIP", 18)
+            flota.plataformas.append(p)
+        return flota
+
+    azul = crear_flota("Azul", "Atlántico")
+    roja = crear_flota("Roja", "Atlántico")
+    resumen = MotorCombate([azul, roja], semilla=0).ejecutar()
+    print(f"{2 * por_flota} plataformas | {resumen['pasos']} pasos ({resumen['minutos']} min simulados) "
+          f"en {resumen['segundos']:.2f} s")
+    print(f"disparos {resumen['disparos']} | impactos {resumen['impactos']} | derribos {resumen['derribos']} | "
+          f"supervivientes {resumen['supervivientes']}")
@@ -1,11 +1,13 @@
 from plataformanaval import PlataformaNaval
+from eventos import emitir
 
 class Corbeta (PlataformaNaval):
-    
+    __slots__ = ("misilesAntibuque", "autonomiaDias")
+
     def __init__(self, nombre, pais, eslora, desplazamiento, velocidadMaxima, misilesAntibuque: int, autonomiaDias: int):
         super().__init__(nombre, pais, eslora, desplazamiento, velocidadMaxima)
-        misilesAntibuque = int(misilesAntibuque)
-        autonomiaDias = int(autonomiaDias)
+        self.misilesAntibuque = int(misilesAntibuque)
+        self.autonomiaDias = int(autonomiaDias)
     
     def __str__(self):
         return (f"Misiles Antibuque: {self.misilesAntibuque}\n"
@@ -14,11 +16,14 @@ class Corbeta (PlataformaNaval):
     
     def dispararMisilAntibuque(self):
         if self.misilesAntibuque > 0:
-            self.misilesAntibuque =-1
-            print("Se ha disparado un misil")
+            self.misilesAntibuque -= 1
+            emitir("misil_antibuque", self.nombre, self.misilesAntibuque)
+
+    def atacar(self):
+        self.dispararMisilAntibuque()
     
     def RealizarPatrulla(self, costera: bool):
         if costera:
-            print("Se está realizando una patrulla")
+            emitir("patrulla", self.nombre)
         else:
-            print("No se está realizando ninguna patrulla")
\ No newline at end of file
+            emitir("sin_patrulla", self.nombre)
\ No newline at end of file
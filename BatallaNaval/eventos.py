@@ -0,0 +1,209 @@
+import atexit
+import json
+import queue
+import struct
+import threading
+import time
+from collections import deque, namedtuple
+
+# =========================================================
+# Registro de eventos de la simulación (en lugar de print)
+# - Las plataformas y flotas llaman a emitir(tipo, origen, dato); a
+#   dónde va el evento lo decide el sumidero activo (usar(...)).
+# - SumideroConsola: escribe los mismos mensajes que antes hacían los
+#   print (es el de por defecto, main.py se ve igual).
+# - SumideroNulo: no hace nada (simulaciones grandes).
+# - SumideroMemoria: los últimos `capacidad` eventos en un buffer circular.
+# - SumideroArchivo: JSON lines o binario; junta los eventos en lotes y
+#   un hilo aparte los escribe, sin parar la simulación. Si la escritura
+#   falla, el error se guarda y los eventos siguientes se descartan
+#   (y se cuentan): la simulación nunca se queda esperando al hilo.
+# =========================================================
+Evento = namedtuple("Evento", ["tipo", "origen", "dato", "instante"])
+
+MENSAJES = {
+    "misil_antiaereo": "¡Misil antiaéreo disparado!",
+    "misil_antibuque": "Se ha disparado un misil",
+    "torpedo": "¡Torpedo lanzado!",
+    "helicoptero": "Se ha despegado un helicoptero",
+    "sin_misiles": "No quedan misiles",
+    "sin_torpedos": "No quedan torpedos",
+    "sin_armas": "La plataforma '{origen}' no tiene armas con las que atacar",
+    "patrulla": "Se está realizando una patrulla",
+    "sin_patrulla": "No se está realizando ninguna patrulla",
+    "detenida": "Se ha detenido la plataforma",
+    "operativa": "La plataforma está operativa",
+    "escaneo_superficie": "Escaneando superficie...",
+    "escaneo_submarino": "Escanenado submarinos...",
+    "plataforma_agregada": "Plataforma '{origen}' agregada a la flota '{dato}'.",
+    "plataforma_retirada": "Plataforma '{origen}' retirada de la flota '{dato}'.",
+    "plataforma_no_esta": "La plataforma no está en la flota.",
+    "orden_ataque": "La flota '{origen}' ordena ataque en la zona '{dato}'...",
+}
+# Código de cada tipo en el formato binario (por orden de MENSAJES)
+CODIGOS = {tipo: i for i, tipo in enumerate(MENSAJES)}
+
+
+def mensaje(evento):
+    return MENSAJES.get(evento.tipo, evento.tipo).format(origen=evento.origen, dato=evento.dato)
+
+
+class SumideroNulo:
+    def emitir(self, tipo, origen, dato=None):
+        pass
+
+    def vaciar(self):
+        pass
+
+    def cerrar(self):
+        pass
+
+
+class SumideroConsola(SumideroNulo):
+    def emitir(self, tipo, origen, dato=None):
+        print(mensaje(Evento(tipo, origen, dato, 0.0)))
+
+
+class SumideroMemoria(SumideroNulo):
+    def __init__(self, capacidad=100000):
+        self.eventos = deque(maxlen=capacidad)
+        self.total = 0
+
+    def emitir(self, tipo, origen, dato=None):
+        self.eventos.append(Evento(tipo, origen, dato, time.time()))
+        self.total += 1
+
+    def __len__(self):
+        return len(self.eventos)
+
+    def __iter__(self):
+        return iter(self.eventos)
+
+
+class SumideroArchivo(SumideroNulo):
+    # Binario, por evento: código (B), instante (d), dato (d, NaN si no es
+    # un número), longitud del origen (H) y el origen en UTF-8.
+    # Los datos que no son números solo se guardan en JSON lines.
+    CABECERA = struct.Struct("<BddH")
+
+    def __init__(self, ruta, formato="jsonl", lote=4096):
+        if formato not in ("jsonl", "binario"):
+            raise ValueError(f"Formato desconocido: {formato}")
+        self.formato = formato
+        self.lote = lote
+        self.pendientes = []
+        self.total = 0              # eventos ya escritos
+        self.descartados = 0
+        self.error = None           # primera excepción del hilo escritor
+        self.archivo = open(ruta, "wb")
+        self.cache_json = {}
+
+        # El hilo escritor recibe lotes enteros; None = terminar
+        self.cola = queue.Queue(maxsize=16)
+        self.hilo = threading.Thread(target=self.escribir, daemon=True)
+        self.hilo.start()
+        atexit.register(self.cerrar)
+
+    def emitir(self, tipo, origen, dato=None):
+        self.pendientes.append((tipo, origen, dato, time.time()))
+        if len(self.pendientes) >= self.lote:
+            self.vaciar()
+
+    def vaciar(self):
+        if self.pendientes:
+            if self.error is not None or not self.hilo.is_alive():
+                self.descartados += len(self.pendientes)
+            else:
+                self.cola.put(self.pendientes)
+            self.pendientes = []
+
+    def cerrar(self):
+        if self.archivo.closed:
+            return
+        atexit.unregister(self.cerrar)
+        self.vaciar()
+        if self.hilo.is_alive():
+            self.cola.put(None)
+            self.hilo.join()
+        self.archivo.close()
+
+    def escribir(self):
+        # Pase lo que pase se sigue sacando de la cola: emitir() no se bloquea
+        while True:
+            lote = self.cola.get()
+            if lote is None:
+                return
+            if self.error is not None:
+                self.descartados += len(lote)
+                continue
+            try:
+                self.escribir_lote(lote)
+                self.total += len(lote)
+            except Exception as e:
+                self.error = e
+                self.descartados += len(lote)
+
+    def escribir_lote(self, lote):
+        if self.formato == "jsonl":
+            datos = "".join(self.linea_json(t, o, d, i) for t, o, d, i in lote).encode("utf-8")
+        else:
+            partes = []
+            for t, o, d, i in lote:
+                origen = str(o).encode("utf-8")
+                numero = float(d) if isinstance(d, (int, float)) else float("nan")
+                partes.append(self.CABECERA.pack(CODIGOS.get(t, 255), i, numero, len(origen)))
+                partes.append(origen)
+            datos = b"".join(partes)
+        self.archivo.write(datos)
+
+    def linea_json(self, tipo, origen, dato, instante):
+        # Tipos y nombres se repiten mucho: se codifican una vez y se guardan
+        return (f'{{"tipo": {self.texto_json(tipo)}, "origen": {self.texto_json(origen)}, '
+                f'"dato": {self.dato_json(dato)}, "instante": {instante!r}}}\n')
+
+    def texto_json(self, texto):
+        codificado = self.cache_json.get(texto)
+        if codificado is None:
+            if len(self.cache_json) > 100000:
+                self.cache_json.clear()
+            codificado = self.cache_json[texto] = json.dumps(texto, ensure_ascii=False)
+        return codificado
+
+    def dato_json(self, dato):
+        if type(dato) is int or (type(dato) is float and dato == dato and abs(dato) != float("inf")):
+            return repr(dato)
+        if isinstance(dato, str):
+            return self.texto_json(dato)
+        return json.dumps(dato, ensure_ascii=False, default=str)
+
+
+def leer_binario(ruta):
+    # Eventos de un fichero escrito por SumideroArchivo(formato="binario")
+    tipos = list(MENSAJES)
+    cabecera = SumideroArchivo.CABECERA
+    with open(ruta, "rb") as f:
+        datos = f.read()
+    pos = 0
+    while pos < len(datos):
+        codigo, instante, numero, largo = cabecera.unpack_from(datos, pos)
+        pos += cabecera.size
+        origen = datos[pos:pos + largo].decode("utf-8")
+        pos += largo
+        tipo = tipos[codigo] if codigo < len(tipos) else "?"
+        yield Evento(tipo, origen, None if numero != numero else numero, instante)
+
+
+sumidero = SumideroConsola()
+
+
+def usar(nuevo):
+    # Cambia el sumidero activo; devuelve el anterior (ya vaciado)
+    global sumidero
+    anterior = sumidero
+    anterior.vaciar()
+    sumidero = nuevo
+    return anterior
+
+
+def emitir(tipo, origen, dato=None):
+    sumidero.emitir(tipo, origen, dato)
@@ -1,3 +1,5 @@
+from eventos import emitir
+
 class Flota:
     def __init__(self,  nombre: str, zonaOperacion: str):
         self.nombre = nombre
@@ -9,17 +11,22 @@ class Flota:
                 f"Zona de Operación: {self.zonaOperacion}")
     def agregarPlataforma(self, p):
         self.plataformas.append(p)
-        print(f"Plataforma '{p.nombre}' agregada a la flota '{self.nombre}'.")
+        emitir("plataforma_agregada", p.nombre, self.nombre)
 
     def retirarPlataforma(self, p):
         if p in self.plataformas:
             self.plataformas.remove(p)
-            print(f"Plataforma '{p.nombre}' retirada de la flota '{self.nombre}'.")
+            emitir("plataforma_retirada", p.nombre, self.nombre)
         else:
-            print("La plataforma no está en la flota.")
+            emitir("plataforma_no_esta", p.nombre, self.nombre)
 
-    def ordenarAtaque(self):
-        print(f"La flota '{self.nombre}' ordena ataque en la zona '{self.zonaOperacion}'...")
-        for plataforma in self.plataformas:
-            plataforma.atacar()
+    def ordenarAtaque(self, enemiga=None, **opciones):
+        emitir("orden_ataque", self.nombre, self.zonaOperacion)
+        if enemiga is None:
+            for plataforma in self.plataformas:
+                plataforma.atacar()
+            return None
+        # Contra otra flota: combate completo con MotorCombate (NumPy solo hace falta aquí)
+        from combate import MotorCombate
+        return MotorCombate([self, enemiga], **opciones).ejecutar()
     
\ No newline at end of file
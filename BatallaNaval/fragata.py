@@ -1,7 +1,9 @@
 from plataformanaval import PlataformaNaval
+from eventos import emitir
 
 class Fragata(PlataformaNaval):
-    
+    __slots__ = ("misilesAntiaereos", "helicopterosEmb", "rolPrincipal")
+
     def __init__(self, nombre, pais, eslora, desplazamiento, velocidadMaxima, misilesAntiaereos: int, helicopterosEmb: int, rolPrincipal: str):
         super().__init__(nombre, pais, eslora, desplazamiento, velocidadMaxima)
         self.misilesAntiaereos = int(misilesAntiaereos)
@@ -16,12 +18,15 @@ class Fragata(PlataformaNaval):
     
     def dispararMisilAA(self):
         if self.misilesAntiaereos > 0:
-            self.misilesAntiaereos =-1
-            print("¡Misil antiaéreo disparado!")
+            self.misilesAntiaereos -= 1
+            emitir("misil_antiaereo", self.nombre, self.misilesAntiaereos)
         else:
-            print("No quedan misiles")
+            emitir("sin_misiles", self.nombre)
+
+    def atacar(self):
+        self.dispararMisilAA()
     
     def despegarHelicoptero(self):
         if self.helicopterosEmb > 0:
-            self.helicopterosEmb =-1
-            print("Se ha despegado un helicoptero")
+            self.helicopterosEmb -= 1
+            emitir("helicoptero", self.nombre, self.helicopterosEmb)
@@ -0,0 +1,60 @@
+import sys
+import tracemalloc
+from fragata import Fragata
+from corbeta import Corbeta
+from submarino import Submarino
+from tablaplataformas import TablaPlataformas
+
+# =========================================================
+# Benchmark de memoria por plataforma
+# - "slots": las clases de verdad (PlataformaNaval con __slots__).
+# - "dict": los mismos atributos guardados en un __dict__ por instancia,
+#   como estaban las clases antes de declarar __slots__.
+# - "tabla": TablaPlataformas, una fila por plataforma y sin objetos
+#   (compactada al acabar, como queda un escenario ya cargado).
+# - Se mide con tracemalloc lo que ocupa crear n plataformas (mezcla de
+#   fragatas, corbetas y submarinos), valores incluidos.
+# =========================================================
+class ConDict:
+    def __init__(self, plataforma):
+        for cls in type(plataforma).__mro__:
+            for nombre in getattr(cls, "__slots__", ()):
+                setattr(self, nombre, getattr(plataforma, nombre))
+
+
+def crear(i):
+    # Valores distintos por plataforma, como en un fichero de escenario real
+    if i % 3 == 0:
+        return Fragata(f"F{i}", "España", 140.0 + i % 7, 5800.0 + i, 28 + i % 3, 32, 1, "Escolta")
+    if i % 3 == 1:
+        return Corbeta(f"C{i}", "España", 90.0 + i % 5, 2500.0 + i, 26 + i % 4, 8, 20)
+    return Submarino(f"S{i}", "España", 80.0 + i % 3, 3000.0 + i, 20, 300, "AIP", 18)
+
+
+def medir(n, forma):
+    tracemalloc.start()
+    antes, _ = tracemalloc.get_traced_memory()
+    if forma == "dict":
+        plataformas = [ConDict(crear(i)) for i in range(n)]
+    elif forma == "tabla":
+        plataformas = TablaPlataformas()
+        for i in range(n):
+            plataformas.agregar(crear(i))
+        plataformas.compactar()
+    else:
+        plataformas = [crear(i) for i in range(n)]
+    despues, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del plataformas
+    return (despues - antes) / n
+
+
+if __name__ == "__main__":
+    # python memoria_plataformas.py [n]
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 300000
+
+    resultados = {forma: medir(n, forma) for forma in ("dict", "slots", "tabla")}
+    print(f"{n} plataformas")
+    for forma, bytes_ in resultados.items():
+        print(f"  {forma:<6} {bytes_:7.1f} bytes/plataforma ({bytes_ * n / 2**20:7.1f} MB) "
+              f"x{resultados['dict'] / bytes_:.1f} menos que con __dict__")
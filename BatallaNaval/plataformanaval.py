@@ -1,10 +1,23 @@
+from eventos import emitir
+
 class PlataformaNaval:
+    # Todos los atributos declarados aquí (y en las subclases): sin __dict__
+    # por instancia. Para millones de plataformas, ver TablaPlataformas.
+    __slots__ = ("nombre", "pais", "eslora", "desplazamiento", "velocidadMaxima",
+                 "rumbo", "velocidad", "puntos", "hundida", "capitan", "sensores")
+
     def __init__(self, nombre: str, pais: str, eslora: float, desplazamiento: float, velocidadMaxima: float):
         self.nombre = nombre
         self.pais = pais
         self.eslora = float(eslora)
         self.desplazamiento = float(desplazamiento)
         self.velocidadMaxima = float(velocidadMaxima)
+        self.rumbo = 0.0
+        self.velocidad = 0.0
+        self.puntos = 0             # daño recibido
+        self.hundida = False
+        self.capitan = None
+        self.sensores = None
     
     def __str__(self):
         return (f"Nombre de la Plataforma: {self.nombre}\n"
@@ -17,12 +30,20 @@ class PlataformaNaval:
         self.rumbo = float(rumbo)
         self.velocidad = float(velocidad)
     
+    def instalarSensores(self, sensores):
+        self.sensores = sensores
+        sensores.plataforma = self
+
     def detenerse(self):
         if self.velocidad == 0:
-            print("Se ha detenido la plataforma")
+            emitir("detenida", self.nombre)
     
     def recibirdaño (self, puntos: int):
         self.puntos = int(puntos)
     
     def estaOperativa (self):
-        print("La plataforma está operativa")
\ No newline at end of file
+        emitir("operativa", self.nombre)
+
+    def atacar(self):
+        # Cada tipo de plataforma ataca con su arma (Fragata, Corbeta, Submarino)
+        emitir("sin_armas", self.nombre)
@@ -0,0 +1,142 @@
+import numpy as np
+
+# =========================================================
+# RejillaEspacial: índice de posiciones por celdas para los sensores
+# - construir(x, y, submarino): ordena las plataformas por celda
+#   (O(n log n)); se vuelve a llamar en cada paso, con las posiciones nuevas.
+# - consultar(x, y, radio): contactos de un solo sensor.
+# - barrido(radios): todos los sensores a la vez. Para cada uno solo se
+#   miran las celdas vecinas, no las n plataformas: O(n log n) en vez
+#   de O(n²) mientras los radios no sean mucho mayores que la celda.
+# - Los resultados del barrido van en formato "CSR": los contactos del
+#   sensor i son contactos[puntero[i]:puntero[i + 1]].
+# =========================================================
+class RejillaEspacial:
+    def __init__(self, celda: float):
+        self.celda = float(celda)
+        self.n = 0
+
+    def construir(self, x, y, submarino=None):
+        self.x = np.asarray(x, dtype=np.float64)
+        self.y = np.asarray(y, dtype=np.float64)
+        self.n = len(self.x)
+        # Qué plataformas son submarinos (las ve el sonar, no el radar)
+        self.submarino = np.zeros(self.n, dtype=bool) if submarino is None else np.asarray(submarino, dtype=bool)
+        if self.n == 0:
+            self.celdas = np.zeros(0, dtype=np.int64)
+            self.inicio = np.zeros(1, dtype=np.int64)
+            self.orden = np.zeros(0, dtype=np.int64)
+            return self
+
+        self.cx = np.floor(self.x / self.celda).astype(np.int64)
+        self.cy = np.floor(self.y / self.celda).astype(np.int64)
+        self.cx0, self.cy0 = self.cx.min(), self.cy.min()
+        self.ancho = self.cx.max() - self.cx0 + 1
+        self.alto = self.cy.max() - self.cy0 + 1
+
+        clave = self.clave(self.cx, self.cy)
+        self.orden = np.argsort(clave, kind="stable")
+        # Solo las celdas ocupadas: el mundo puede ser enorme y estar casi vacío
+        self.celdas, primero = np.unique(clave[self.orden], return_index=True)
+        self.inicio = np.append(primero, self.n)
+        return self
+
+    def clave(self, cx, cy):
+        return (cy - self.cy0) * self.ancho + (cx - self.cx0)
+
+    def rango_celdas(self, cx, cy):
+        # (inicio, fin) en self.orden de las plataformas de cada celda; vacías = (0, 0)
+        dentro = (cx >= self.cx0) & (cx < self.cx0 + self.ancho) & (cy >= self.cy0) & (cy < self.cy0 + self.alto)
+        clave = self.clave(cx, cy)
+        pos = np.minimum(np.searchsorted(self.celdas, clave), len(self.celdas) - 1)
+        existe = dentro & (self.celdas[pos] == clave)
+        s = np.where(existe, self.inicio[pos], 0)
+        e = np.where(existe, self.inicio[pos + 1], 0)
+        return s, e
+
+    def consultar(self, x, y, radio, excluir=-1):
+        if self.n == 0:
+            return np.zeros(0, dtype=np.int64)
+        k = int(np.ceil(radio / self.celda))
+        ox, oy = np.meshgrid(np.arange(-k, k + 1), np.arange(-k, k + 1))
+        s, e = self.rango_celdas(int(np.floor(x / self.celda)) + ox.ravel(), int(np.floor(y / self.celda)) + oy.ravel())
+        candidatos = self.orden[np.concatenate([np.arange(a, b) for a, b in zip(s, e)])]
+        d2 = (self.x[candidatos] - x) ** 2 + (self.y[candidatos] - y) ** 2
+        return np.sort(candidatos[(d2 <= radio * radio) & (candidatos != excluir)])
+
+    def barrido(self, radios, visibles=None):
+        # radios[i] = alcance del sensor de la plataforma i (0 = sin sensor).
+        # visibles: máscara de las plataformas que ese sensor puede detectar.
+        radios = np.asarray(radios, dtype=np.float64)
+        fuentes = np.flatnonzero(radios > 0)
+        origenes, contactos = [], []
+        if self.n and len(fuentes):
+            k = int(np.ceil(radios.max() / self.celda))
+            fcx, fcy = self.cx[fuentes], self.cy[fuentes]
+            for dx in range(-k, k + 1):
+                for dy in range(-k, k + 1):
+                    s, e = self.rango_celdas(fcx + dx, fcy + dy)
+                    cuantos = e - s
+                    total = int(cuantos.sum())
+                    if total == 0:
+                        continue
+                    # Un par (sensor, candidato) por cada plataforma de la celda vecina
+                    origen = np.repeat(fuentes, cuantos)
+                    desplazamiento = np.arange(total) - np.repeat(np.cumsum(cuantos) - cuantos, cuantos)
+                    candidato = self.orden[np.repeat(s, cuantos) + desplazamiento]
+
+                    d2 = (self.x[origen] - self.x[candidato]) ** 2 + (self.y[origen] - self.y[candidato]) ** 2
+                    vale = (d2 <= radios[origen] ** 2) & (candidato != origen)
+                    if visibles is not None:
+                        vale &= visibles[candidato]
+                    origenes.append(origen[vale])
+                    contactos.append(candidato[vale])
+
+        origen = np.concatenate(origenes) if origenes else np.zeros(0, dtype=np.int64)
+        contacto = np.concatenate(contactos) if contactos else np.zeros(0, dtype=np.int64)
+        orden = np.lexsort((contacto, origen))
+        puntero = np.zeros(self.n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(origen, minlength=self.n), out=puntero[1:])
+        return puntero, contacto[orden]
+
+
+def barrido_sensores(x, y, sensores, submarino, celda=None):
+    # sensores[i]: SistemaSensores de la plataforma i (o None).
+    # Radar: contactos de superficie. Sonar: submarinos.
+    # Devuelve (radar, sonar), cada uno como (puntero, contactos).
+    radar = np.array([s.rangoDeteccion if s is not None and s.tieneRadar else 0.0 for s in sensores])
+    sonar = np.array([s.rangoDeteccion if s is not None and s.tieneSonar else 0.0 for s in sensores])
+    if celda is None:
+        celda = max(radar.max(initial=0.0), sonar.max(initial=0.0), 1.0)
+
+    rejilla = RejillaEspacial(celda).construir(x, y, submarino)
+    return rejilla.barrido(radar, ~rejilla.submarino), rejilla.barrido(sonar, rejilla.submarino)
+
+
+# Prueba: 10.000 plataformas, rejilla contra todos con todos
+if __name__ == "__main__":
+    import sys
+    import time
+
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    rng = np.random.default_rng(0)
+    x = rng.uniform(0, 2000, n)
+    y = rng.uniform(0, 2000, n)
+    radios = rng.uniform(10, 40, n)
+
+    inicio = time.perf_counter()
+    puntero, contactos = RejillaEspacial(40).construir(x, y).barrido(radios)
+    t_rejilla = time.perf_counter() - inicio
+
+    # Todos con todos (O(n²)), por bloques para no agotar la memoria
+    inicio = time.perf_counter()
+    total = 0
+    for i in range(0, n, 1000):
+        d2 = (x[i:i + 1000, None] - x[None, :]) ** 2 + (y[i:i + 1000, None] - y[None, :]) ** 2
+        dentro = d2 <= radios[i:i + 1000, None] ** 2
+        dentro[np.arange(len(dentro)), np.arange(i, i + len(dentro))] = False
+        total += int(dentro.sum())
+    t_todos = time.perf_counter() - inicio
+
+    print(f"{n} plataformas | rejilla: {t_rejilla * 1000:.1f} ms | todos con todos: {t_todos * 1000:.1f} ms | "
+          f"contactos: {len(contactos)} (esperados {total})")
@@ -0,0 +1,62 @@
+import os
+import sys
+import time
+import tempfile
+import contextlib
+import eventos
+from eventos import SumideroConsola, SumideroNulo, SumideroMemoria, SumideroArchivo, leer_binario
+from fragata import Fragata
+
+# =========================================================
+# Benchmark de eventos: n disparos de fragata con cada sumidero
+# - consola: el print de siempre (a /dev/null, para no medir el terminal)
+# - nulo, memoria, jsonl y binario: sin tocar la consola
+# =========================================================
+def disparar(n):
+    fragata = Fragata("F1", "España", 140, 5800, 28, n, 1, "Escolta")
+    inicio = time.perf_counter()
+    for _ in range(n):
+        fragata.dispararMisilAA()
+    return time.perf_counter() - inicio
+
+
+def medir(nombre, sumidero, n):
+    anterior = eventos.usar(sumidero)
+    try:
+        if nombre == "consola":
+            with open(os.devnull, "w") as nulo, contextlib.redirect_stdout(nulo):
+                segundos = disparar(n)
+        else:
+            segundos = disparar(n)
+        # El tiempo de cerrar (esperar al hilo escritor) también cuenta
+        inicio = time.perf_counter()
+        sumidero.cerrar()
+        segundos += time.perf_counter() - inicio
+    finally:
+        eventos.usar(anterior)
+    return segundos
+
+
+if __name__ == "__main__":
+    # python rendimiento_eventos.py [n]
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    carpeta = tempfile.mkdtemp()
+    ruta_jsonl = os.path.join(carpeta, "eventos.jsonl")
+    ruta_binario = os.path.join(carpeta, "eventos.bin")
+
+    sumideros = {
+        "consola": SumideroConsola(),
+        "nulo": SumideroNulo(),
+        "memoria": SumideroMemoria(capacidad=100000),
+        "jsonl": SumideroArchivo(ruta_jsonl, "jsonl"),
+        "binario": SumideroArchivo(ruta_binario, "binario"),
+    }
+    print(f"{n} disparos")
+    for nombre, sumidero in sumideros.items():
+        segundos = medir(nombre, sumidero, n)
+        print(f"  {nombre:<8} {segundos:6.2f} s  ({segundos / n * 1e9:6.0f} ns/evento)")
+
+    leidos = sum(1 for _ in leer_binario(ruta_binario))
+    print(f"eventos en el fichero binario: {leidos} | "
+          f"tamaños: jsonl {os.path.getsize(ruta_jsonl) / 2**20:.1f} MB, "
+          f"binario {os.path.getsize(ruta_binario) / 2**20:.1f} MB")
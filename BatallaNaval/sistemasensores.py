@@ -1,11 +1,28 @@
+from eventos import emitir
+
 class SistemaSensores ():
     def __init__(self, tieneRadar, tieneSonar, rangoDeteccion: float):
         self.tieneRadar = tieneRadar
         self.tieneSonar = tieneSonar
         self.rangoDeteccion = float(rangoDeteccion)
+        self.plataforma = None      # la que lleva el sensor (PlataformaNaval.instalarSensores)
+
+    def origen(self):
+        return self.plataforma.nombre if self.plataforma is not None else ""
     
-    def escanearSuperficie(self):
-        print("Escaneando superficie...")
+    # rejilla: RejillaEspacial construida con las posiciones de este paso;
+    # (x, y): posición de la plataforma que lleva el sensor, propio: su índice.
+    # Devuelven los índices de los contactos dentro de rangoDeteccion.
+    def escanearSuperficie(self, rejilla=None, x=0.0, y=0.0, propio=-1):
+        emitir("escaneo_superficie", self.origen(), self.rangoDeteccion)
+        if rejilla is None or not self.tieneRadar:
+            return []
+        contactos = rejilla.consultar(x, y, self.rangoDeteccion, propio)
+        return contactos[~rejilla.submarino[contactos]]
 
-    def escanearSubmarino(self):
-        print("Escanenado submarinos...")
\ No newline at end of file
+    def escanearSubmarino(self, rejilla=None, x=0.0, y=0.0, propio=-1):
+        emitir("escaneo_submarino", self.origen(), self.rangoDeteccion)
+        if rejilla is None or not self.tieneSonar:
+            return []
+        contactos = rejilla.consultar(x, y, self.rangoDeteccion, propio)
+        return contactos[rejilla.submarino[contactos]]
\ No newline at end of file
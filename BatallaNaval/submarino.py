@@ -1,11 +1,15 @@
 from plataformanaval import PlataformaNaval
+from eventos import emitir
 
 class Submarino (PlataformaNaval):
+    __slots__ = ("profundidadMaxima", "tipoPropulsion", "tubosLanzatorpedos", "profundidad")
+
     def __init__(self, nombre, pais, eslora, desplazamiento, VelocidadMaxima, profundidadMaxima: int, tipoPropulsion: str, tubosLanzatorpedos: int):
         super().__init__(nombre, pais, eslora, desplazamiento, VelocidadMaxima)
         self.profundidadMaxima = int(profundidadMaxima)
         self.tipoPropulsion = tipoPropulsion
         self.tubosLanzatorpedos = int(tubosLanzatorpedos)
+        self.profundidad = 0
     
     def __str__(self, profundidadMaxima, tipoPropulsion, tubosLanzatorpedos):
         return (f"Profundidad Máxima: {profundidadMaxima}\n"
@@ -19,6 +23,13 @@ class Submarino (PlataformaNaval):
         self.profundidad = 0 
     
     def lanzarTorpedo (self):
-        pass
+        if self.tubosLanzatorpedos > 0:
+            self.tubosLanzatorpedos -= 1
+            emitir("torpedo", self.nombre, self.tubosLanzatorpedos)
+        else:
+            emitir("sin_torpedos", self.nombre)
+
+    def atacar(self):
+        self.lanzarTorpedo()
 
         
\ No newline at end of file
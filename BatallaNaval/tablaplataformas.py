@@ -0,0 +1,151 @@
+from array import array
+import numpy as np
+from plataformanaval import PlataformaNaval
+from fragata import Fragata
+from corbeta import Corbeta
+from submarino import Submarino
+
+# =========================================================
+# TablaPlataformas: muchas plataformas en columnas, sin un objeto por cada una
+# - Una columna de NumPy por atributo numérico y una fila por plataforma,
+#   del tipo más pequeño que sirve: float32 para eslora, desplazamiento,
+#   velocidades y rumbo (de sobra para esos rangos), int32 para los
+#   contadores (un int16 se daría la vuelta sin avisar pasado 32767),
+#   int16 para los códigos de categoría (con comprobación al añadir).
+# - La capacidad crece al doble; compactar() devuelve lo que sobra
+#   cuando ya no se van a añadir más filas.
+# - Los textos que se repiten (país, rol, propulsión) se guardan como
+#   códigos de categoría; los nombres, todos juntos en un bytearray UTF-8.
+# - plataforma(i) crea el objeto Fragata/Corbeta/Submarino de una fila
+#   cuando hace falta trabajar con él.
+# - guardar/cargar: ficheros de escenario .npz.
+# - capitan y sensores son referencias a otros objetos: no van a la tabla.
+# =========================================================
+TIPOS = (PlataformaNaval, Fragata, Corbeta, Submarino)
+
+COLUMNAS = {
+    "tipo": np.int8,
+    "eslora": np.float32,
+    "desplazamiento": np.float32,
+    "velocidadMaxima": np.float32,
+    "rumbo": np.float32,
+    "velocidad": np.float32,
+    "puntos": np.int32,
+    "hundida": np.bool_,
+    "misilesAntiaereos": np.int32,
+    "helicopterosEmb": np.int32,
+    "misilesAntibuque": np.int32,
+    "autonomiaDias": np.int32,
+    "profundidadMaxima": np.int32,
+    "tubosLanzatorpedos": np.int32,
+    "profundidad": np.int32,
+    "pais": np.int16,
+    "rolPrincipal": np.int16,
+    "tipoPropulsion": np.int16,
+}
+CATEGORIAS = ("pais", "rolPrincipal", "tipoPropulsion")
+
+
+class TablaPlataformas:
+    def __init__(self, capacidad=1024):
+        self.n = 0
+        self.columnas = {nombre: np.zeros(capacidad, dtype=dtype) for nombre, dtype in COLUMNAS.items()}
+        self.categorias = {nombre: [] for nombre in CATEGORIAS}    # código -> texto
+        self.codigos = {nombre: {} for nombre in CATEGORIAS}       # texto -> código
+        self.nombres = bytearray()
+        self.fin_nombre = array("q")                                # dónde acaba cada nombre
+
+    def __len__(self):
+        return self.n
+
+    def __getitem__(self, atributo):
+        # tabla["velocidad"] -> columna de las n filas (vista, sin copiar)
+        return self.columnas[atributo][:self.n]
+
+    def crecer(self):
+        # Capacidad x2: añadir filas sigue siendo O(1) amortizado
+        for nombre, viejo in self.columnas.items():
+            nuevo = np.zeros(max(1024, len(viejo) * 2), dtype=viejo.dtype)
+            nuevo[:self.n] = viejo[:self.n]
+            self.columnas[nombre] = nuevo
+
+    def compactar(self):
+        # Capacidad = filas ocupadas (p. ej. tras cargar un escenario entero)
+        for nombre, viejo in self.columnas.items():
+            self.columnas[nombre] = viejo[:self.n].copy()
+
+    def codigo(self, categoria, texto):
+        codigos = self.codigos[categoria]
+        if texto not in codigos:
+            if len(codigos) > np.iinfo(COLUMNAS[categoria]).max:
+                raise ValueError(f"Demasiados valores distintos de {categoria}")
+            codigos[texto] = len(self.categorias[categoria])
+            self.categorias[categoria].append(texto)
+        return codigos[texto]
+
+    def agregar(self, plataforma):
+        if self.n == len(self.columnas["tipo"]):
+            self.crecer()
+        fila = self.n
+        self.n += 1
+
+        for nombre, columna in self.columnas.items():
+            if nombre == "tipo":
+                columna[fila] = TIPOS.index(type(plataforma))
+            elif nombre in CATEGORIAS:
+                columna[fila] = self.codigo(nombre, getattr(plataforma, nombre, ""))
+            else:
+                columna[fila] = getattr(plataforma, nombre, 0)
+
+        self.nombres += plataforma.nombre.encode("utf-8")
+        self.fin_nombre.append(len(self.nombres))
+        return fila
+
+    def agregar_muchas(self, plataformas):
+        for p in plataformas:
+            self.agregar(p)
+
+    def nombre(self, fila):
+        inicio = self.fin_nombre[fila - 1] if fila else 0
+        return self.nombres[inicio:self.fin_nombre[fila]].decode("utf-8")
+
+    def plataforma(self, fila):
+        # Objeto completo de la fila (sin pasar por __init__)
+        cls = TIPOS[self.columnas["tipo"][fila]]
+        p = cls.__new__(cls)
+        p.nombre = self.nombre(fila)
+        p.capitan = None
+        p.sensores = None
+        for clase in cls.__mro__:
+            for atributo in getattr(clase, "__slots__", ()):
+                if atributo in CATEGORIAS:
+                    setattr(p, atributo, self.categorias[atributo][self.columnas[atributo][fila]])
+                elif atributo in self.columnas:
+                    setattr(p, atributo, self.columnas[atributo][fila].item())
+        return p
+
+    # -----------------------------
+    # Ficheros de escenario
+    # -----------------------------
+    def guardar(self, ruta):
+        datos = {nombre: columna[:self.n] for nombre, columna in self.columnas.items()}
+        for nombre in CATEGORIAS:
+            datos["categorias_" + nombre] = np.array(self.categorias[nombre], dtype=str)
+        datos["nombres"] = np.frombuffer(bytes(self.nombres), dtype=np.uint8)
+        datos["fin_nombre"] = np.frombuffer(self.fin_nombre, dtype=np.int64)
+        np.savez(ruta, **datos)
+
+    @classmethod
+    def cargar(cls, ruta):
+        with np.load(ruta) as datos:
+            n = len(datos["tipo"])
+            tabla = cls(capacidad=max(1, n))
+            tabla.n = n
+            for nombre in COLUMNAS:
+                tabla.columnas[nombre][:n] = datos[nombre]
+            for nombre in CATEGORIAS:
+                tabla.categorias[nombre] = [str(t) for t in datos["categorias_" + nombre]]
+                tabla.codigos[nombre] = {t: i for i, t in enumerate(tabla.categorias[nombre])}
+            tabla.nombres = bytearray(datos["nombres"].tobytes())
+            tabla.fin_nombre = array("q", datos["fin_nombre"].tobytes())
+        return tabla
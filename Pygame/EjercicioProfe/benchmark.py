@@ -0,0 +1,208 @@
+import os
+import sys
+import csv
+import json
+import math
+import time
+import random
+import importlib
+import subprocess
+import tracemalloc
+
+# Sin ventana ni tarjeta de sonido: SDL usa drivers "dummy"
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import pygame
+
+try:
+    import resource
+except ImportError:
+    resource = None  # Windows: no hay getrusage, el RSS pico sale vacío
+
+
+# =========================================================
+# Benchmark de coste por frame: recogePunto2 ... recogePunto7
+# - Cada versión corre en su propio proceso (el RSS pico es por proceso).
+# - Misma entrada guionizada y misma semilla para todas las versiones.
+# - Por frame se ejecuta lo mismo que en Game.run sin clock.tick:
+#   eventos + update + draw.
+# - Pasada 1: tiempos. Pasada 2 (tracemalloc): cuánto sube el pico de
+#   memoria de Python durante el frame sobre lo que había al empezarlo
+#   (peak_kb_growth). No es el total asignado: temporales que se crean y
+#   se liberan uno tras otro apenas cuentan. Lo que SDL reserva en C
+#   (p. ej. al renderizar texto) no aparece; para eso está el tiempo de draw.
+# =========================================================
+VERSIONS = ["recogePunto2", "recogePunto3", "recogePunto4", "recogePunto5", "recogePunto6", "recogePunto7"]
+
+# Cada 30 frames cambia la dirección del jugador (flechas) y del enemigo humano (WASD)
+SCRIPT = [
+    (pygame.K_RIGHT, pygame.K_s),
+    (pygame.K_DOWN, pygame.K_a),
+    (pygame.K_LEFT, pygame.K_w),
+    (pygame.K_UP, pygame.K_d),
+]
+
+
+class ScriptedKeys:
+    # Se indexa igual que pygame.key.get_pressed()
+    def __init__(self, pressed):
+        self.pressed = set(pressed)
+
+    def __getitem__(self, key):
+        return key in self.pressed
+
+
+# Creadas una sola vez para no contar asignaciones del propio benchmark
+SCRIPTED_KEYS = [ScriptedKeys(pressed) for pressed in SCRIPT]
+current_keys = SCRIPTED_KEYS[0]
+
+
+def scripted_keys(frame):
+    return SCRIPTED_KEYS[(frame // 30) % len(SCRIPTED_KEYS)]
+
+
+def scripted_get_pressed():
+    return current_keys
+
+
+def make_game(module):
+    random.seed(0)
+    if "seed" in module.Game.__init__.__code__.co_varnames:
+        game = module.Game(seed=0)
+    else:
+        game = module.Game()
+
+    # Empezar la partida directamente (sin pasar por el menú)
+    if hasattr(game, "set_enemy_mode"):
+        game.set_enemy_mode("AUTO")
+    if hasattr(game, "start_game"):
+        game.start_game()
+    return game
+
+
+def run_frame(game, frame):
+    global current_keys
+    keys = scripted_keys(frame)
+    current_keys = keys
+
+    game.handle_events()
+    if hasattr(game, "step"):
+        game.step(keys)
+    else:
+        game.update()
+    game.draw()
+
+    # Si el enemigo gana, se vuelve a empezar para no medir la pantalla de Game Over
+    state = getattr(game, "state", None)
+    if state is not None and state.is_game_over():
+        game.start_game()
+
+
+def percentile(sorted_data, p):
+    k = math.ceil(p / 100 * len(sorted_data)) - 1
+    return sorted_data[max(0, min(len(sorted_data) - 1, k))]
+
+
+def bench_version(name, frames, warmup=60):
+    module = importlib.import_module(name)
+    original_get_pressed = pygame.key.get_pressed
+    pygame.key.get_pressed = scripted_get_pressed
+
+    try:
+        # Pasada 1: tiempos
+        game = make_game(module)
+        for frame in range(warmup):
+            run_frame(game, frame)
+
+        times = []
+        for frame in range(frames):
+            start = time.perf_counter()
+            run_frame(game, frame)
+            times.append((time.perf_counter() - start) * 1000)
+
+        # Pasada 2: crecimiento del pico de memoria por frame (tracemalloc frena, por eso va aparte)
+        game = make_game(module)
+        for frame in range(warmup):
+            run_frame(game, frame)
+
+        tracemalloc.start()
+        peak_growth = 0
+        for frame in range(frames):
+            tracemalloc.reset_peak()
+            before, _ = tracemalloc.get_traced_memory()
+            run_frame(game, frame)
+            _, peak = tracemalloc.get_traced_memory()
+            peak_growth += peak - before
+        tracemalloc.stop()
+    finally:
+        pygame.key.get_pressed = original_get_pressed
+        pygame.quit()
+
+    times.sort()
+    peak_rss_mb = None
+    if resource is not None:
+        # ru_maxrss: KB en Linux, bytes en macOS
+        rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        peak_rss_mb = rss / (1024 * 1024) if sys.platform == "darwin" else rss / 1024
+
+    return {
+        "version": name,
+        "frames": frames,
+        "mean_ms": sum(times) / len(times),
+        "p50_ms": percentile(times, 50),
+        "p95_ms": percentile(times, 95),
+        "p99_ms": percentile(times, 99),
+        "peak_kb_growth": peak_growth / frames / 1024,
+        "peak_rss_mb": peak_rss_mb,
+    }
+
+
+def run_all(versions, frames):
+    # Un subproceso por versión: imports, cachés y RSS no se mezclan
+    here = os.path.dirname(os.path.abspath(__file__))
+    results = []
+    for name in versions:
+        proc = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), "--one", name, str(frames)],
+            cwd=here, capture_output=True, text=True,
+        )
+        if proc.returncode != 0:
+            error = proc.stderr.strip().splitlines()
+            results.append({"version": name, "error": error[-1] if error else "error"})
+            continue
+        results.append(json.loads(proc.stdout.strip().splitlines()[-1]))
+    return results
+
+
+def print_table(results):
+    print(f"{'versión':<14}{'media ms':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'pico KB':>10}{'RSS MB':>9}")
+    for r in results:
+        if "error" in r:
+            print(f"{r['version']:<14}  ERROR: {r['error']}")
+            continue
+        rss = f"{r['peak_rss_mb']:.1f}" if r["peak_rss_mb"] is not None else "-"
+        print(f"{r['version']:<14}{r['mean_ms']:>10.3f}{r['p50_ms']:>10.3f}{r['p95_ms']:>10.3f}"
+              f"{r['p99_ms']:>10.3f}{r['peak_kb_growth']:>10.2f}{rss:>9}")
+
+
+def write_csv(results, path):
+    fields = ["version", "frames", "mean_ms", "p50_ms", "p95_ms", "p99_ms", "peak_kb_growth", "peak_rss_mb", "error"]
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=fields)
+        writer.writeheader()
+        for r in results:
+            writer.writerow(r)
+
+
+if __name__ == "__main__":
+    # python benchmark.py [frames] [resultados.csv]
+    if len(sys.argv) > 1 and sys.argv[1] == "--one":
+        print(json.dumps(bench_version(sys.argv[2], int(sys.argv[3]))))
+    else:
+        frames = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+        results = run_all(VERSIONS, frames)
+        print_table(results)
+        if len(sys.argv) > 2:
+            write_csv(results, sys.argv[2])
@@ -0,0 +1,264 @@
+import pygame
+import csv
+import math
+import sys
+import time
+import importlib
+from array import array
+
+
+# =========================================================
+# FrameProfiler: instrumentación opcional de Game.run
+# - Sirve para cualquier versión (recogePunto3 ... recogePunto7): envuelve
+#   los métodos de la instancia de Game, sin tocar su código.
+# - Mide handle_events, update, cada check_*, draw y clock.tick.
+# - Frames delimitados con begin_frame/end_frame: el frame empieza al
+#   llamar a handle_events (lo primero del bucle en todas las versiones),
+#   así cada fila junta tick, update y draw de la misma vuelta aunque
+#   recogePunto7 haga el tick antes del update.
+# - Guarda los últimos `capacity` frames en un buffer circular.
+# - Dibuja una gráfica de tiempo por frame encima del HUD. Para eso
+#   envuelve pygame.display.flip/update, pero solo entre enable() y
+#   disable(); el rect de la gráfica se envía siempre, aunque el
+#   DirtyRenderer no tenga nada sucio ese frame.
+# - Al terminar vuelca p50/p95/p99 por sección a un CSV.
+# =========================================================
+class FrameProfiler:
+    BUDGET_MS = 1000 / 60   # 16.6 ms a 60 FPS
+
+    def __init__(self, capacity=600, overlay=True):
+        self.capacity = capacity
+        self.overlay = overlay
+
+        self.sections = []          # orden de las columnas
+        self.samples = {}           # sección -> array("d") circular (ms)
+        self.current = {}           # sección -> ms acumulados en este frame
+        self.index = 0
+        self.count = 0
+        self.frame_start = None     # None = no hay frame abierto
+        self.presented = False      # ¿se ha enviado algo a pantalla en este frame?
+
+        self.game = None
+        self.original_flip = None
+        self.original_update = None
+        self.font = None
+        self.label = None
+        self.label_frame = -1
+
+    # -----------------------------
+    # Enganche al juego
+    # -----------------------------
+    def add_section(self, name):
+        if name not in self.samples:
+            self.sections.append(name)
+            self.samples[name] = array("d", [0.0] * self.capacity)
+            self.current[name] = 0.0
+
+    def attach(self, game):
+        self.game = game
+
+        names = ["handle_events", "update"]
+        names += sorted(n for n in dir(game) if n.startswith("check_") and callable(getattr(game, n)))
+        names += ["draw"]
+        for name in names:
+            if hasattr(game, name):
+                self.add_section(name)
+                wrapped = self.timed(name, getattr(game, name))
+                if name == "handle_events":
+                    wrapped = self.starts_frame(wrapped)
+                setattr(game, name, wrapped)
+
+        self.add_section("clock.tick")
+        self.add_section("frame")
+        game.clock = TimedClock(game.clock, self)
+
+    def enable(self):
+        # La gráfica se pinta justo antes de enviar el frame a pantalla
+        if self.overlay and self.original_flip is None:
+            self.original_flip = pygame.display.flip
+            self.original_update = pygame.display.update
+            pygame.display.flip = self.flip_with_overlay
+            pygame.display.update = self.update_with_overlay
+
+    def disable(self):
+        # Aquí el juego ya puede haber cerrado la pantalla (pygame.quit)
+        if self.frame_start is not None:
+            self.end_frame(present=False)
+        if self.original_flip is not None:
+            pygame.display.flip = self.original_flip
+            pygame.display.update = self.original_update
+            self.original_flip = None
+            self.original_update = None
+
+    def starts_frame(self, func):
+        def wrapper(*args, **kwargs):
+            self.begin_frame()
+            return func(*args, **kwargs)
+        return wrapper
+
+    def timed(self, name, func):
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.current[name] += (time.perf_counter() - start) * 1000
+        return wrapper
+
+    def begin_frame(self):
+        # Cierra el frame anterior (si lo hay) y abre uno nuevo
+        if self.frame_start is not None:
+            self.end_frame()
+        self.frame_start = time.perf_counter()
+        self.presented = False
+
+    def end_frame(self, present=True):
+        # Cierra la fila del frame en el buffer
+        if present and not self.presented and self.original_update is not None:
+            # Frame sin nada sucio: la gráfica se envía igual, si no se congela
+            area = self.draw_overlay()
+            if area is not None:
+                self.original_update([area])
+        self.current["frame"] = (time.perf_counter() - self.frame_start) * 1000
+        self.frame_start = None
+
+        for name in self.sections:
+            self.samples[name][self.index] = self.current[name]
+            self.current[name] = 0.0
+        self.index = (self.index + 1) % self.capacity
+        self.count += 1
+
+    # -----------------------------
+    # Estadísticas
+    # -----------------------------
+    def values(self, name):
+        n = min(self.count, self.capacity)
+        if self.count <= self.capacity:
+            return list(self.samples[name][:n])
+        # Buffer lleno: del más antiguo al más reciente
+        return list(self.samples[name][self.index:]) + list(self.samples[name][:self.index])
+
+    def stats(self):
+        rows = []
+        for name in self.sections:
+            data = sorted(self.values(name))
+            if not data:
+                continue
+            rows.append({
+                "section": name,
+                "frames": len(data),
+                "mean_ms": sum(data) / len(data),
+                "p50_ms": percentile(data, 50),
+                "p95_ms": percentile(data, 95),
+                "p99_ms": percentile(data, 99),
+                "max_ms": data[-1],
+            })
+        return rows
+
+    def write_csv(self, path):
+        rows = self.stats()
+        fields = ["section", "frames", "mean_ms", "p50_ms", "p95_ms", "p99_ms", "max_ms"]
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=fields)
+            writer.writeheader()
+            for row in rows:
+                writer.writerow({k: round(v, 4) if isinstance(v, float) else v for k, v in row.items()})
+        return rows
+
+    # -----------------------------
+    # Overlay: gráfica de tiempo por frame
+    # -----------------------------
+    def flip_with_overlay(self):
+        self.draw_overlay()
+        self.original_flip()
+        self.presented = True
+
+    def update_with_overlay(self, rects=None):
+        self.presented = True
+        area = self.draw_overlay()
+        if rects is None:
+            self.original_update()
+            return
+        if isinstance(rects, pygame.Rect) or (rects and isinstance(rects[0], (int, float))):
+            rects = [rects]
+        if area is not None:
+            rects = list(rects) + [area]
+        self.original_update(rects)
+
+    def draw_overlay(self, graph_w=240, graph_h=80):
+        screen = pygame.display.get_surface()
+        if screen is None or self.count == 0:
+            return None
+
+        area = pygame.Rect(screen.get_width() - graph_w - 10, 10, graph_w, graph_h + 22)
+        screen.fill((20, 20, 20), area)
+
+        # Barras: 2 x presupuesto = altura completa; rojo si pasa de 16.6 ms
+        scale = graph_h / (self.BUDGET_MS * 2)
+        frames = self.values("frame")[-graph_w // 2:]
+        base_y = area.y + 22 + graph_h
+        for i, ms in enumerate(frames):
+            bar_h = min(graph_h, int(ms * scale))
+            color = (220, 80, 80) if ms > self.BUDGET_MS else (80, 200, 120)
+            pygame.draw.rect(screen, color, (area.x + i * 2, base_y - bar_h, 2, bar_h))
+
+        budget_y = base_y - int(self.BUDGET_MS * scale)
+        pygame.draw.line(screen, (240, 240, 240), (area.x, budget_y), (area.right - 1, budget_y))
+
+        # El texto solo se re-renderiza cada 30 frames (font.render es caro)
+        if self.label is None or self.count - self.label_frame >= 30:
+            if self.font is None:
+                self.font = pygame.font.SysFont(None, 20)
+            data = sorted(frames)
+            text = f"p50 {percentile(data, 50):.1f} | p95 {percentile(data, 95):.1f} | p99 {percentile(data, 99):.1f} ms"
+            self.label = self.font.render(text, True, (240, 240, 240))
+            self.label_frame = self.count
+        screen.blit(self.label, (area.x + 4, area.y + 4))
+        return area
+
+
+class TimedClock:
+    # Sustituye a game.clock: mide tick() dentro del frame en curso
+    def __init__(self, clock, profiler):
+        self.clock = clock
+        self.profiler = profiler
+
+    def tick(self, *args):
+        start = time.perf_counter()
+        result = self.clock.tick(*args)
+        self.profiler.current["clock.tick"] += (time.perf_counter() - start) * 1000
+        return result
+
+    def __getattr__(self, name):
+        return getattr(self.clock, name)
+
+
+def percentile(sorted_data, p):
+    # Percentil por rango más cercano sobre una lista ya ordenada
+    if not sorted_data:
+        return 0.0
+    k = math.ceil(p / 100 * len(sorted_data)) - 1
+    return sorted_data[max(0, min(len(sorted_data) - 1, k))]
+
+
+def profile_game(game, csv_path="perfil.csv", capacity=600, overlay=True):
+    profiler = FrameProfiler(capacity=capacity, overlay=overlay)
+    profiler.attach(game)
+    profiler.enable()
+    try:
+        game.run()
+    finally:
+        profiler.disable()
+        profiler.write_csv(csv_path)
+    return profiler
+
+
+if __name__ == "__main__":
+    # python profiler.py recogePunto7 [perfil.csv]
+    module_name = sys.argv[1] if len(sys.argv) > 1 else "recogePunto7"
+    csv_path = sys.argv[2] if len(sys.argv) > 2 else "perfil.csv"
+
+    module = importlib.import_module(module_name)
+    profiler = profile_game(module.Game(), csv_path)
+    for row in profiler.stats():
+        print(f"{row['section']:<22} p50 {row['p50_ms']:7.3f}  p95 {row['p95_ms']:7.3f}  p99 {row['p99_ms']:7.3f} ms")
@@ -1,6 +1,18 @@
 import pygame
 import random
+import io
 import os
+import sys
+import struct
+import threading
+import zlib
+from array import array
+from collections import OrderedDict
+
+try:
+    import numpy as np
+except ImportError:
+    np = None  # sin NumPy no hay modo enjambre (AutoEnemySwarm)
 
 
 # =========================================================
@@ -11,6 +23,229 @@ def asset_path(*parts):
     return os.path.join(base, "assets", *parts)
 
 
+def load_image(path):
+    # Las imágenes salen del AssetManager (precargadas en segundo plano)
+    return assets.image(path)
+
+
+# =========================================================
+# AssetManager: precarga de imágenes y sonidos en un hilo
+# - declare() apunta los recursos que va a necesitar el juego.
+# - start() los decodifica en un hilo mientras se muestra el menú;
+#   progress() dice cuánto falta.
+# - image() entrega la imagen ya lista. La conversión al formato de
+#   pantalla (convert_alpha) se hace en el hilo principal, una sola vez
+#   por imagen.
+# - music() entrega los bytes del fichero de música, leídos en el hilo:
+#   se sigue reproduciendo en streaming (mixer.music), pero sin tocar el
+#   disco al empezar la partida.
+# =========================================================
+class AssetManager:
+    def __init__(self):
+        self.declared = {}          # ruta -> "image" / "music"
+        self.pending = []           # rutas aún sin decodificar
+        self.decoded = {}           # ruta -> Surface decodificada / bytes de la música
+        self.images = {}            # ruta -> Surface lista para dibujar
+        self.errors = {}            # ruta -> excepción al cargar
+        self.loaded = 0
+        self.lock = threading.Lock()
+        self.done = threading.Event()
+        self.done.set()
+        self.thread = None
+
+    def declare(self, path, kind="image"):
+        with self.lock:
+            if path in self.declared:
+                return
+            self.declared[path] = kind
+            self.pending.append(path)
+
+    def start(self, background=True):
+        with self.lock:
+            if not self.pending or not self.done.is_set():
+                return
+            self.done.clear()
+
+        if background:
+            self.thread = threading.Thread(target=self.load_pending, daemon=True)
+            self.thread.start()
+        else:
+            self.load_pending()
+
+    def load_pending(self):
+        while True:
+            with self.lock:
+                if not self.pending:
+                    self.done.set()
+                    return
+                path = self.pending.pop(0)
+                kind = self.declared[path]
+
+            try:
+                if kind == "music":
+                    with open(path, "rb") as f:
+                        asset = f.read()
+                else:
+                    asset = pygame.image.load(path)
+            except (pygame.error, OSError) as e:
+                with self.lock:
+                    self.errors[path] = e
+                    self.loaded += 1
+                continue
+
+            with self.lock:
+                self.decoded[path] = asset
+                self.loaded += 1
+
+    def progress(self):
+        with self.lock:
+            total = len(self.declared)
+            return 1.0 if total == 0 else self.loaded / total
+
+    def is_ready(self):
+        return self.done.is_set()
+
+    def wait(self):
+        self.done.wait()
+
+    def image(self, path):
+        image = self.images.get(path)
+        if image is not None:
+            return image
+
+        if path in self.declared:
+            self.wait()
+        image = self.decoded.pop(path, None)
+        if image is None:
+            # No declarada (o falló la precarga): carga normal, que lanza el error
+            image = pygame.image.load(path)
+
+        # Sin ventana (modo headless) no se puede convertir al formato de pantalla
+        if pygame.display.get_surface() is not None:
+            image = image.convert_alpha()
+        self.images[path] = image
+        return image
+
+    def music(self, path):
+        # Bytes del fichero; None si no se declaró o no se pudo leer
+        if path in self.declared:
+            self.wait()
+        return self.decoded.get(path)
+
+
+assets = AssetManager()
+
+
+# =========================================================
+# GameClock: tiempo de simulación a pasos fijos
+# - Sustituye a pygame.time.get_ticks() en la lógica del juego.
+# - Game lo avanza step_ms en cada paso, así el modo ventana y el
+#   modo headless producen exactamente la misma partida.
+# =========================================================
+class GameClock:
+    def __init__(self):
+        self.ms = 0.0
+
+    def reset(self):
+        self.ms = 0.0
+
+    def advance(self, dt_ms):
+        self.ms += dt_ms
+
+    def get_ticks(self):
+        return int(self.ms)
+
+
+game_clock = GameClock()
+
+
+# =========================================================
+# KeySnapshot: teclas pulsadas sin depender de pygame.key
+# (se indexa igual que pygame.key.get_pressed())
+# =========================================================
+class KeySnapshot:
+    def __init__(self, pressed=()):
+        self.pressed = set(pressed)
+
+    def __getitem__(self, key):
+        return key in self.pressed
+
+
+# =========================================================
+# InputLog: grabación compacta de una partida para reproducirla
+# - Cabecera: semilla de la partida, reloj al empezar, modo de enemigo,
+#   objetivo de la IA y nº de monedas/enemigos/power-ups.
+# - Un uint16 por paso: un bit por tecla de RECORDED_KEYS + bit de pausa.
+# - Los pasos van comprimidos con zlib (las teclas se repiten mucho).
+# =========================================================
+RECORDED_KEYS = (
+    pygame.K_LEFT, pygame.K_RIGHT, pygame.K_UP, pygame.K_DOWN,
+    pygame.K_a, pygame.K_d, pygame.K_w, pygame.K_s,
+)
+PAUSED_BIT = 1 << len(RECORDED_KEYS)
+
+
+class InputLog:
+    MAGIC = b"RP7R"
+    VERSION = 1
+    HEADER = struct.Struct("<4sBIdBBHHHI")
+
+    def __init__(self, seed, start_ms=0.0, enemy_mode="AUTO", target_mode="PLAYER",
+                 num_coins=1, num_enemies=1, num_powerups=1):
+        self.seed = seed
+        self.start_ms = start_ms
+        self.enemy_mode = enemy_mode
+        self.target_mode = target_mode
+        self.num_coins = num_coins
+        self.num_enemies = num_enemies
+        self.num_powerups = num_powerups
+        self.masks = array("H")
+
+    def record(self, keys, paused=False):
+        mask = PAUSED_BIT if paused else 0
+        for bit, key in enumerate(RECORDED_KEYS):
+            if keys[key]:
+                mask |= 1 << bit
+        self.masks.append(mask)
+
+    def keys_at(self, frame):
+        mask = self.masks[frame]
+        return KeySnapshot(key for bit, key in enumerate(RECORDED_KEYS) if mask & (1 << bit))
+
+    def paused_at(self, frame):
+        return bool(self.masks[frame] & PAUSED_BIT)
+
+    def save(self, path):
+        header = self.HEADER.pack(
+            self.MAGIC, self.VERSION, self.seed, self.start_ms,
+            1 if self.enemy_mode == "AUTO" else 0,
+            1 if self.target_mode == "COIN" else 0,
+            self.num_coins, self.num_enemies, self.num_powerups,
+            len(self.masks),
+        )
+        with open(path, "wb") as f:
+            f.write(header)
+            f.write(zlib.compress(self.masks.tobytes()))
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as f:
+            data = f.read()
+
+        (magic, version, seed, start_ms, auto, coin, num_coins, num_enemies,
+         num_powerups, frames) = cls.HEADER.unpack_from(data)
+        if magic != cls.MAGIC or version != cls.VERSION:
+            raise ValueError(f"{path} no es una grabación de recogePunto7")
+
+        log = cls(seed, start_ms,
+                  "AUTO" if auto else "HUMAN", "COIN" if coin else "PLAYER",
+                  num_coins, num_enemies, num_powerups)
+        log.masks.frombytes(zlib.decompress(data[cls.HEADER.size:]))
+        if len(log.masks) != frames:
+            raise ValueError(f"{path} está incompleto")
+        return log
+
+
 # =========================================================
 # StateManager
 # =========================================================
@@ -43,9 +278,13 @@ class StateManager:
 # SoundManager: mute global + música
 # =========================================================
 class SoundManager:
-    def __init__(self):
+    def __init__(self, enabled=True):
         self.enabled = False
         self.muted = False
+        self.music_volume = 0.6
+
+        if not enabled:
+            return
 
         try:
             pygame.mixer.init()
@@ -59,19 +298,25 @@ class SoundManager:
             return
 
         # Mute afecta a la música (y a futuros SFX si los añades)
-        if self.muted:
-            pygame.mixer.music.set_volume(0.0)
-        else:
-            pygame.mixer.music.set_volume(0.6)
+        pygame.mixer.music.set_volume(0.0 if self.muted else self.music_volume)
 
     def start_music_loop(self, filepath, volume=0.6):
         if not self.enabled:
             return
-        if not os.path.exists(filepath):
+        self.music_volume = volume
+
+        # La música va en streaming (mixer.music), no decodificada entera en
+        # memoria; si está precargada, el stream sale de sus bytes, sin disco
+        data = assets.music(filepath)
+        if data is None and (filepath in assets.declared or not os.path.exists(filepath)):
             return
 
         try:
-            pygame.mixer.music.load(filepath)
+            if data is not None:
+                namehint = os.path.splitext(filepath)[1].lstrip(".")
+                pygame.mixer.music.load(io.BytesIO(data), namehint=namehint)
+            else:
+                pygame.mixer.music.load(filepath)
             pygame.mixer.music.set_volume(0.0 if self.muted else volume)
             pygame.mixer.music.play(-1)  # -1 = loop infinito
         except pygame.error:
@@ -83,6 +328,37 @@ class SoundManager:
         pygame.mixer.music.stop()
 
 
+# =========================================================
+# TextCache: superficies de texto ya renderizadas (LRU)
+# - Clave: (fuente, texto, color, antialias)
+# - font.render() es lo más caro de cada frame; los textos del HUD y
+#   de los menús casi nunca cambian, así que se reutilizan.
+# =========================================================
+class TextCache:
+    def __init__(self, max_size=128):
+        self.max_size = max_size
+        self.surfaces = OrderedDict()
+
+    def render(self, font, text, color, antialias=True):
+        key = (font, text, color, antialias)
+        surf = self.surfaces.get(key)
+        if surf is not None:
+            self.surfaces.move_to_end(key)
+            return surf
+
+        surf = font.render(text, antialias, color)
+        self.surfaces[key] = surf
+        if len(self.surfaces) > self.max_size:
+            self.surfaces.popitem(last=False)
+        return surf
+
+    def clear(self):
+        self.surfaces.clear()
+
+
+text_cache = TextCache()
+
+
 # =========================================================
 # HUD
 # =========================================================
@@ -91,6 +367,10 @@ class Score:
         self.font = font
         self.points = 0
 
+        # Superficie del texto: solo se vuelve a renderizar si cambian los puntos
+        self.surf = None
+        self.rendered_points = None
+
     def reset(self):
         self.points = 0
 
@@ -98,8 +378,10 @@ class Score:
         self.points += amount
 
     def draw(self, screen, x=10, y=10):
-        surf = self.font.render(f"Puntuación: {self.points}", True, (240, 240, 240))
-        screen.blit(surf, (x, y))
+        if self.rendered_points != self.points:
+            self.surf = self.font.render(f"Puntuación: {self.points}", True, (240, 240, 240))
+            self.rendered_points = self.points
+        screen.blit(self.surf, (x, y))
 
 
 class Lives:
@@ -108,6 +390,9 @@ class Lives:
         self.initial_lives = initial_lives
         self.lives = initial_lives
 
+        self.surf = None
+        self.rendered_lives = None
+
     def reset(self):
         self.lives = self.initial_lives
 
@@ -120,8 +405,69 @@ class Lives:
         return self.lives == 0
 
     def draw(self, screen, x=10, y=45):
-        surf = self.font.render(f"Vidas: {self.lives}", True, (240, 240, 240))
-        screen.blit(surf, (x, y))
+        if self.rendered_lives != self.lives:
+            self.surf = self.font.render(f"Vidas: {self.lives}", True, (240, 240, 240))
+            self.rendered_lives = self.lives
+        screen.blit(self.surf, (x, y))
+
+
+# =========================================================
+# FrameAtlasCache: frames de sprite sheets compartidos
+# - Clave: (ruta, ancho, alto, filas, columnas, escala)
+# - Cada sprite que usa una entrada suma una referencia; al liberarla
+#   la entrada queda "sin uso" y solo se descarta (LRU) si hay más de
+#   max_unused entradas sin uso. Así recrear el enemigo no vuelve a
+#   decodificar ni a escalar la imagen.
+# =========================================================
+class FrameAtlasCache:
+    def __init__(self, max_unused=4):
+        self.max_unused = max_unused
+        self.entries = {}               # clave -> frames por filas
+        self.refs = {}                  # clave -> nº de sprites que la usan
+        self.unused = OrderedDict()     # claves sin referencias (LRU)
+
+    def acquire(self, sheet_path, frame_w, frame_h, rows, cols, scale=1):
+        key = (sheet_path, frame_w, frame_h, rows, cols, scale)
+        if key not in self.entries:
+            self.entries[key] = self.build_frames(*key)
+
+        self.refs[key] = self.refs.get(key, 0) + 1
+        self.unused.pop(key, None)
+        return key, self.entries[key]
+
+    def release(self, key):
+        self.refs[key] -= 1
+        if self.refs[key] > 0:
+            return
+
+        del self.refs[key]
+        self.unused[key] = True
+        while len(self.unused) > self.max_unused:
+            old_key, _ = self.unused.popitem(last=False)
+            del self.entries[old_key]
+
+    def clear(self):
+        self.entries.clear()
+        self.refs.clear()
+        self.unused.clear()
+
+    def build_frames(self, sheet_path, frame_w, frame_h, rows, cols, scale):
+        sheet = load_image(sheet_path)
+
+        # Tuplas: los frames se comparten y nadie debe modificarlos
+        frames_by_row = []
+        for r in range(rows):
+            row_frames = []
+            for c in range(cols):
+                frame = sheet.subsurface((c * frame_w, r * frame_h, frame_w, frame_h))
+                if scale != 1:
+                    frame = pygame.transform.scale(frame, (frame_w * scale, frame_h * scale))
+                row_frames.append(frame)
+            frames_by_row.append(tuple(row_frames))
+        return tuple(frames_by_row)
+
+
+frame_atlas = FrameAtlasCache()
 
 
 # =========================================================
@@ -131,8 +477,6 @@ class AnimatedSprite(pygame.sprite.Sprite):
     def __init__(self, sheet_path, frame_w, frame_h, rows, cols, scale=1, frame_time_ms=120, row_index=0):
         super().__init__()
 
-        self.sheet = pygame.image.load(sheet_path).convert_alpha()
-
         self.frame_w = frame_w
         self.frame_h = frame_h
         self.rows = rows
@@ -141,21 +485,13 @@ class AnimatedSprite(pygame.sprite.Sprite):
         self.scale = scale
         self.frame_time_ms = frame_time_ms
 
-        # Guardamos frames por filas (lista de listas)
-        self.frames_by_row = []
-        for r in range(rows):
-            row_frames = []
-            for c in range(cols):
-                frame = self.sheet.subsurface((c * frame_w, r * frame_h, frame_w, frame_h))
-                if scale != 1:
-                    frame = pygame.transform.scale(frame, (frame_w * scale, frame_h * scale))
-                row_frames.append(frame)
-            self.frames_by_row.append(row_frames)
+        # Frames por filas compartidos con el resto de sprites de la misma sheet
+        self.frames_key, self.frames_by_row = frame_atlas.acquire(sheet_path, frame_w, frame_h, rows, cols, scale)
 
         # Fila que se va a animar (por defecto 0)
         self.set_animation_row(row_index)
 
-        self.last_frame_change_ms = pygame.time.get_ticks()
+        self.last_frame_change_ms = game_clock.get_ticks()
 
     def set_animation_row(self, row_index):
         self.row_index = row_index
@@ -175,7 +511,7 @@ class AnimatedSprite(pygame.sprite.Sprite):
 
 
     def animate(self):
-        now = pygame.time.get_ticks()
+        now = game_clock.get_ticks()
         if now - self.last_frame_change_ms >= self.frame_time_ms:
             self.frame_index = (self.frame_index + 1) % len(self.frames)
             self.image = self.frames[self.frame_index]
@@ -187,6 +523,12 @@ class AnimatedSprite(pygame.sprite.Sprite):
 
             self.last_frame_change_ms = now
 
+    def release_frames(self):
+        # Avisar a la caché cuando el sprite deja de usarse
+        if self.frames_key is not None:
+            frame_atlas.release(self.frames_key)
+            self.frames_key = None
+
 
 # =========================================================
 # Player: animado + composición Lives + invencibilidad 3s
@@ -218,13 +560,12 @@ class Player(AnimatedSprite):
         self.rect.topleft = self.spawn_pos
 
     def set_invincible(self, duration_ms=3000):
-        self.invincible_until_ms = pygame.time.get_ticks() + duration_ms
+        self.invincible_until_ms = game_clock.get_ticks() + duration_ms
 
     def is_invincible(self):
-        return pygame.time.get_ticks() < self.invincible_until_ms
+        return game_clock.get_ticks() < self.invincible_until_ms
 
-    def update(self, w, h):
-        keys = pygame.key.get_pressed()
+    def update(self, w, h, keys):
         dx = 0
         dy = 0
         if keys[pygame.K_LEFT]:
@@ -291,8 +632,7 @@ class HumanEnemy(Enemy):
     def __init__(self, x, y):
         super().__init__(x, y)
 
-    def update(self, w, h, player=None, coin=None):
-        keys = pygame.key.get_pressed()
+    def update(self, w, h, keys, player=None, coin=None):
         dx = 0
         dy = 0
         if keys[pygame.K_a]:
@@ -319,7 +659,7 @@ class AutoEnemy(Enemy):
     def set_target_mode(self, target_mode):
         self.target_mode = target_mode
 
-    def update(self, w, h, player=None, coin=None):
+    def update(self, w, h, keys, player=None, coin=None):
         if self.target_mode == "COIN" and coin is not None:
             tx, ty = coin.rect.centerx, coin.rect.centery
         elif player is not None:
@@ -348,35 +688,114 @@ class AutoEnemy(Enemy):
             self.animate()
 
 
+# =========================================================
+# AutoEnemySwarm: muchos AutoEnemy movidos en bloque con NumPy
+# - Posiciones, tamaños, velocidades y objetivos viven en arrays.
+# - update() hace la misma persecución que AutoEnemy.update (un paso
+#   de `speed` por eje hacia el objetivo + keep_inside) para todos a la
+#   vez; solo la copia al rect de cada sprite (para dibujar) es por sprite.
+# =========================================================
+class AutoEnemySwarm:
+    def __init__(self, enemies):
+        self.enemies = list(enemies)
+
+        self.pos = np.array([e.rect.topleft for e in self.enemies], dtype=np.int64).reshape(-1, 2)
+        self.size = np.array([e.rect.size for e in self.enemies], dtype=np.int64).reshape(-1, 2)
+        self.spawn = np.array([e.spawn_pos for e in self.enemies], dtype=np.int64).reshape(-1, 2)
+        self.speed = np.array([e.speed for e in self.enemies], dtype=np.int64)
+        self.chase_coin = np.array([e.target_mode == "COIN" for e in self.enemies], dtype=bool)
+
+    def set_target_mode(self, target_mode):
+        for enemy in self.enemies:
+            enemy.set_target_mode(target_mode)
+        self.chase_coin[:] = target_mode == "COIN"
+
+    def respawn(self):
+        self.pos[:] = self.spawn
+        self.sync_rects()
+
+    def update(self, w, h, player=None, coin=None):
+        if player is None and coin is None:
+            return
+
+        if player is not None:
+            tx = np.full(len(self.enemies), player.rect.centerx, dtype=np.int64)
+            ty = np.full(len(self.enemies), player.rect.centery, dtype=np.int64)
+            if coin is not None:
+                tx[self.chase_coin] = coin.rect.centerx
+                ty[self.chase_coin] = coin.rect.centery
+            active = None
+        else:
+            # Sin jugador solo se mueven los que persiguen la moneda
+            tx = np.full(len(self.enemies), coin.rect.centerx, dtype=np.int64)
+            ty = np.full(len(self.enemies), coin.rect.centery, dtype=np.int64)
+            active = self.chase_coin
+
+        centers = self.pos + self.size // 2
+        step = np.empty_like(self.pos)
+        step[:, 0] = np.sign(tx - centers[:, 0]) * self.speed
+        step[:, 1] = np.sign(ty - centers[:, 1]) * self.speed
+        if active is not None:
+            step[~active] = 0
+
+        self.pos += step
+
+        # keep_inside para todos
+        np.clip(self.pos[:, 0], 0, w - self.size[:, 0], out=self.pos[:, 0])
+        np.clip(self.pos[:, 1], 0, h - self.size[:, 1], out=self.pos[:, 1])
+
+        self.sync_rects(moved=(step != 0).any(axis=1))
+
+    def sync_rects(self, moved=None):
+        positions = self.pos.tolist()
+        if moved is None:
+            for enemy, topleft in zip(self.enemies, positions):
+                enemy.rect.topleft = topleft
+            return
+
+        for enemy, topleft, has_moved in zip(self.enemies, positions, moved.tolist()):
+            enemy.rect.topleft = topleft
+            if has_moved:
+                enemy.animate()
+
+    def collides(self, rect):
+        # Igual que colliderect, pero contra todo el enjambre de una vez
+        x, y = self.pos[:, 0], self.pos[:, 1]
+        w, h = self.size[:, 0], self.size[:, 1]
+        return bool(np.any((x < rect.right) & (x + w > rect.left) & (y < rect.bottom) & (y + h > rect.top)))
+
+
 # =========================================================
 # Coin: sprite con imagen
 # =========================================================
 class Coin(pygame.sprite.Sprite):
-    def __init__(self, w, h):
+    def __init__(self, w, h, rng=random):
         super().__init__()
-        self.image = pygame.image.load(asset_path("coin.png")).convert_alpha()
+        self.image = load_image(asset_path("coin.png"))
         self.image = pygame.transform.scale(self.image, (24, 24))
         self.rect = self.image.get_rect()
         self.w = w
         self.h = h
+        self.rng = rng
         self.respawn()
 
     def respawn(self):
-        self.rect.centerx = random.randint(20, self.w - 20)
-        self.rect.centery = random.randint(20, self.h - 20)
+        self.rect.centerx = self.rng.randint(20, self.w - 20)
+        self.rect.centery = self.rng.randint(20, self.h - 20)
 
 
 # =========================================================
 # PowerUp invencibilidad: imagen + aparece a intervalos
 # =========================================================
 class InvincibilityPowerUp(pygame.sprite.Sprite):
-    def __init__(self, w, h):
+    def __init__(self, w, h, rng=random):
         super().__init__()
-        self.image = pygame.image.load(asset_path("powerup.png")).convert_alpha()
+        self.image = load_image(asset_path("powerup.png"))
         self.image = pygame.transform.scale(self.image, (28, 28))
         self.rect = self.image.get_rect()
         self.w = w
         self.h = h
+        self.rng = rng
 
         self.active = False
         self.spawned_at_ms = 0
@@ -384,10 +803,10 @@ class InvincibilityPowerUp(pygame.sprite.Sprite):
         self.duration_ms = 3000
 
     def spawn(self):
-        self.rect.centerx = random.randint(20, self.w - 20)
-        self.rect.centery = random.randint(20, self.h - 20)
+        self.rect.centerx = self.rng.randint(20, self.w - 20)
+        self.rect.centery = self.rng.randint(20, self.h - 20)
         self.active = True
-        self.spawned_at_ms = pygame.time.get_ticks()
+        self.spawned_at_ms = game_clock.get_ticks()
 
     def despawn(self):
         self.active = False
@@ -395,39 +814,229 @@ class InvincibilityPowerUp(pygame.sprite.Sprite):
     def update(self):
         if not self.active:
             return
-        if pygame.time.get_ticks() - self.spawned_at_ms > self.lifetime_ms:
+        if game_clock.get_ticks() - self.spawned_at_ms > self.lifetime_ms:
             self.despawn()
 
 
+# =========================================================
+# SpatialHash: rejilla uniforme para la fase amplia de colisiones
+# - Cada sprite se apunta en las celdas que toca su rect.
+# - move() solo toca la rejilla si el sprite cambia de celdas.
+# - query(rect) revisa solo las celdas del rect, así comprobar el
+#   jugador contra cientos de monedas/enemigos no es O(n) por frame.
+# =========================================================
+class SpatialHash:
+    def __init__(self, cell_size=64):
+        self.cell_size = cell_size
+        # dicts como conjuntos ordenados: el orden de los resultados no
+        # depende de id(), así la partida es reproducible
+        self.cells = {}             # (cx, cy) -> {sprite: None}
+        self.sprite_cells = {}      # sprite -> celdas que ocupa
+
+    def cells_for(self, rect):
+        cs = self.cell_size
+        return tuple(
+            (cx, cy)
+            for cx in range(rect.left // cs, (rect.right - 1) // cs + 1)
+            for cy in range(rect.top // cs, (rect.bottom - 1) // cs + 1)
+        )
+
+    def insert(self, sprite):
+        self.move(sprite)
+
+    def move(self, sprite):
+        new_cells = self.cells_for(sprite.rect)
+        old_cells = self.sprite_cells.get(sprite, ())
+        if new_cells == old_cells:
+            return
+
+        self.unlink(sprite, old_cells)
+        for cell in new_cells:
+            self.cells.setdefault(cell, {})[sprite] = None
+        self.sprite_cells[sprite] = new_cells
+
+    def remove(self, sprite):
+        old_cells = self.sprite_cells.pop(sprite, None)
+        if old_cells is not None:
+            self.unlink(sprite, old_cells)
+
+    def unlink(self, sprite, cells):
+        for cell in cells:
+            bucket = self.cells[cell]
+            bucket.pop(sprite, None)
+            if not bucket:
+                del self.cells[cell]
+
+    def clear(self):
+        self.cells.clear()
+        self.sprite_cells.clear()
+
+    def candidates(self, rect):
+        found = {}
+        for cell in self.cells_for(rect):
+            bucket = self.cells.get(cell)
+            if bucket:
+                found.update(bucket)
+        return found
+
+    def query(self, rect):
+        # Sprites que chocan de verdad con rect (fase estrecha con colliderect)
+        return [sprite for sprite in self.candidates(rect) if rect.colliderect(sprite.rect)]
+
+    def pairs(self, sprites):
+        # Parejas (sprite, otro) que chocan entre `sprites` y los de la rejilla
+        for sprite in sprites:
+            for other in self.query(sprite.rect):
+                yield sprite, other
+
+
+# =========================================================
+# DirtyRenderer: solo envía a pantalla lo que ha cambiado
+# - draw() apunta los blits (superficie + rect) en vez de pintar.
+# - present() los compara con los del frame anterior: lo que aparece,
+#   desaparece o se mueve marca su rect como sucio.
+# - Los rects sucios que se tocan se funden en uno; cada rect resultante
+#   se limpia y se redibuja recortado con set_clip (solo los blits que
+#   lo tocan, buscados con collidelistall), y solo esos rects se envían
+#   con pygame.display.update(rects).
+# - Si hay demasiados rects sucios (MAX_DIRTY) o cubren más de
+#   MAX_DIRTY_AREA de la pantalla, sale más barato el frame completo.
+# - Con dirty_rects=False se vuelve al fill + flip de toda la pantalla.
+# =========================================================
+class DirtyRenderer:
+    MAX_DIRTY = 32
+    MAX_DIRTY_AREA = 0.3
+
+    def __init__(self, screen, bg_color=(0, 0, 0), dirty_rects=True):
+        self.screen = screen
+        self.bg_color = bg_color
+        self.dirty_rects = dirty_rects
+
+        self.blits = []
+        self.prev_blits = []
+        self.full_redraw = True
+
+    def blit(self, surf, pos):
+        # Misma firma que Surface.blit (pos puede ser tupla o Rect)
+        rect = surf.get_rect(topleft=(pos[0], pos[1]))
+        self.blits.append((surf, rect))
+        return rect
+
+    def invalidate(self):
+        # Fuerza un frame completo (p. ej. si algo pinta fuera del renderer)
+        self.full_redraw = True
+
+    def present(self):
+        dirty = None
+        if not self.full_redraw and self.dirty_rects:
+            dirty = self.find_dirty()
+
+        if dirty is None:
+            self.screen.fill(self.bg_color)
+            self.screen.blits(self.blits, doreturn=False)
+            pygame.display.flip()
+        elif dirty:
+            rects = [rect for _, rect in self.blits]
+            for area in dirty:
+                self.screen.set_clip(area)
+                self.screen.fill(self.bg_color)
+                self.screen.blits([self.blits[i] for i in area.collidelistall(rects)], doreturn=False)
+            self.screen.set_clip(None)
+            pygame.display.update(dirty)
+
+        # prev_blits mantiene vivas las superficies del frame anterior
+        self.prev_blits = self.blits
+        self.blits = []
+        self.full_redraw = False
+
+    def find_dirty(self):
+        # Rects sucios ya fundidos, o None si compensa redibujar todo
+        current = {(surf, tuple(rect)) for surf, rect in self.blits}
+        previous = {(surf, tuple(rect)) for surf, rect in self.prev_blits}
+        changed = [r for _, r in current - previous] + [r for _, r in previous - current]
+        if len(changed) > self.MAX_DIRTY * 4:
+            return None
+
+        merged = []
+        for r in changed:
+            rect = pygame.Rect(r)
+            i = rect.collidelist(merged)
+            while i != -1:
+                rect.union_ip(merged.pop(i))
+                i = rect.collidelist(merged)
+            merged.append(rect)
+
+        if len(merged) > self.MAX_DIRTY:
+            return None
+        screen_area = self.screen.get_width() * self.screen.get_height()
+        if sum(r.w * r.h for r in merged) > screen_area * self.MAX_DIRTY_AREA:
+            return None
+        return merged
+
+
 # =========================================================
 # Game
 # =========================================================
 class Game:
-    def __init__(self):
+    def __init__(self, headless=False, dirty_rects=True, num_coins=1, num_enemies=1, num_powerups=1, swarm=False,
+                 seed=None, record_path=None):
         self.width = 800
         self.height = 600
         self.fps = 60
 
+        # Paso fijo de simulación (ms). En ventana se acumula el tiempo real
+        # y se ejecutan tantos pasos como quepan (máx. max_steps_per_frame).
+        self.headless = headless
+        self.step_ms = 1000 / self.fps
+        self.max_steps_per_frame = 5
+
         pygame.init()
-        self.screen = pygame.display.set_mode((self.width, self.height))
-        pygame.display.set_caption("Recoge el punto - Versión 7 (animaciones + música)")
+        if headless:
+            self.screen = None
+            self.renderer = None
+        else:
+            self.screen = pygame.display.set_mode((self.width, self.height))
+            pygame.display.set_caption("Recoge el punto - Versión 7 (animaciones + música)")
+            # dirty_rects=False -> fill + flip de pantalla completa cada frame
+            self.renderer = DirtyRenderer(self.screen, (0, 0, 0), dirty_rects=dirty_rects)
         self.clock = pygame.time.Clock()
+        game_clock.reset()
 
         self.font = pygame.font.SysFont(None, 36)
         self.big_font = pygame.font.SysFont(None, 60)
 
         self.state = StateManager()
-        self.sounds = SoundManager()
+        self.sounds = SoundManager(enabled=not headless)
 
-        self.score = Score(self.font)
-        lives_component = Lives(self.font, initial_lives=3)
-        self.player = Player(x=100, y=self.height // 2, lives_component=lives_component)
+        # Todo el azar sale de self.rng; cada partida se resiembra con
+        # session_seed para poder grabarla y reproducirla (InputLog)
+        self.rng = random.Random(seed)
+        self.session_seed = None
+        self.record_path = record_path
+        self.recording = None
 
-        self.coin = Coin(self.width, self.height)
-        self.powerup = InvincibilityPowerUp(self.width, self.height)
+        self.score = Score(self.font)
 
-        self.enemy = None
+        # Varias monedas / enemigos / power-ups, cada tipo en su rejilla.
+        # Los sprites se crean en build_world() cuando las imágenes están listas.
+        self.num_coins = num_coins
+        self.num_enemies = num_enemies
+        self.num_powerups = num_powerups
+        self.world_built = False
+        self.player = None
+        self.coins = []
+        self.powerups = []
+
+        self.coin_grid = SpatialHash()
+        self.enemy_grid = SpatialHash()
+        self.powerup_grid = SpatialHash()
+
+        self.enemies = []
         self.enemy_mode = None           # "HUMAN" / "AUTO"
+
+        # Enjambre NumPy para los enemigos AUTO (solo si NumPy está instalado)
+        self.use_swarm = swarm and np is not None
+        self.swarm = None
         self.auto_target_mode = "PLAYER" # "PLAYER" / "COIN"
 
         # Gestión de spawn del power-up
@@ -438,35 +1047,87 @@ class Game:
         self.music_path = asset_path("music.mp3")
         self.music_playing = False
 
+        # Precarga: en ventana se decodifica en un hilo mientras se ve el menú
+        for name in ("player.png", "coin.png", "powerup.png"):
+            assets.declare(asset_path(name))
+        if self.sounds.enabled and os.path.exists(self.music_path):
+            assets.declare(self.music_path, "music")
+        assets.start(background=not headless)
+        if headless:
+            self.build_world()
+
         self.running = True
 
+    def build_world(self):
+        # Crea jugador, monedas y power-ups (espera a la precarga si hace falta)
+        lives_component = Lives(self.font, initial_lives=3)
+        self.player = Player(x=100, y=self.height // 2, lives_component=lives_component)
+
+        self.coins = [Coin(self.width, self.height, self.rng) for _ in range(self.num_coins)]
+        self.powerups = [InvincibilityPowerUp(self.width, self.height, self.rng) for _ in range(self.num_powerups)]
+        for coin in self.coins:
+            self.coin_grid.insert(coin)
+
+        self.world_built = True
+
     def schedule_next_powerup(self):
-        now = pygame.time.get_ticks()
-        self.next_powerup_at_ms = now + random.randint(4000, 9000)
+        now = game_clock.get_ticks()
+        self.next_powerup_at_ms = now + self.rng.randint(4000, 9000)
 
     def maybe_spawn_powerup(self):
-        if self.powerup.active:
+        if game_clock.get_ticks() < self.next_powerup_at_ms:
             return
-        if pygame.time.get_ticks() >= self.next_powerup_at_ms:
-            self.powerup.spawn()
-            self.schedule_next_powerup()
+        for powerup in self.powerups:
+            if not powerup.active:
+                powerup.spawn()
+                self.powerup_grid.insert(powerup)
+                self.schedule_next_powerup()
+                return
+
+    def despawn_powerup(self, powerup):
+        powerup.despawn()
+        self.powerup_grid.remove(powerup)
+
+    def respawn_coin(self, coin):
+        coin.respawn()
+        self.coin_grid.move(coin)
 
     def set_enemy_mode(self, mode):
         self.enemy_mode = mode
         ex = self.width - 140
-        ey = self.height // 2
 
-        if mode == "HUMAN":
-            self.enemy = HumanEnemy(ex, ey)
-        elif mode == "AUTO":
-            self.enemy = AutoEnemy(ex, ey, target_mode=self.auto_target_mode)
+        for enemy in self.enemies:
+            enemy.release_frames()
+        self.enemies = []
+        self.enemy_grid.clear()
+
+        for i in range(self.num_enemies):
+            # Repartidos en vertical (con 1 enemigo: en el centro)
+            ey = (i + 1) * self.height // (self.num_enemies + 1)
+            if mode == "HUMAN":
+                enemy = HumanEnemy(ex, ey)
+            elif mode == "AUTO":
+                enemy = AutoEnemy(ex, ey, target_mode=self.auto_target_mode)
+            else:
+                continue
+            self.enemies.append(enemy)
+
+        # En modo enjambre las colisiones con enemigos van por AutoEnemySwarm
+        self.swarm = None
+        if mode == "AUTO" and self.use_swarm and self.enemies:
+            self.swarm = AutoEnemySwarm(self.enemies)
         else:
-            self.enemy = None
+            for enemy in self.enemies:
+                self.enemy_grid.insert(enemy)
 
     def set_auto_target_mode(self, target_mode):
         self.auto_target_mode = target_mode
-        if isinstance(self.enemy, AutoEnemy):
-            self.enemy.set_target_mode(target_mode)
+        if self.swarm is not None:
+            self.swarm.set_target_mode(target_mode)
+            return
+        for enemy in self.enemies:
+            if isinstance(enemy, AutoEnemy):
+                enemy.set_target_mode(target_mode)
 
     def start_music_if_needed(self):
         # Iniciamos música al entrar en PLAYING
@@ -479,22 +1140,55 @@ class Game:
             self.sounds.stop_music()
             self.music_playing = False
 
-    def start_game(self):
+    def start_game(self, session_seed=None):
+        if not self.world_built:
+            self.build_world()
+
+        if session_seed is None:
+            session_seed = self.rng.getrandbits(32)
+        self.session_seed = session_seed
+        self.rng.seed(session_seed)
+
+        if not self.enemies:
+            self.set_enemy_mode("HUMAN")
+
         self.score.reset()
         self.player.lives.reset()
         self.player.respawn()
-        self.coin.respawn()
-
-        if self.enemy is None:
-            self.set_enemy_mode("HUMAN")
-        self.enemy.respawn()
+        self.player.invincible_until_ms = 0
+        self.reset_world()
 
-        self.powerup.despawn()
         self.schedule_next_powerup()
 
         self.state.set_state(StateManager.PLAYING)
         self.start_music_if_needed()
 
+        if self.record_path:
+            self.finish_recording()
+            self.recording = InputLog(
+                session_seed, game_clock.ms, self.enemy_mode, self.auto_target_mode,
+                len(self.coins), self.num_enemies, len(self.powerups),
+            )
+
+    def finish_recording(self):
+        # Se guarda la última partida jugada (sobrescribe record_path)
+        if self.recording is not None:
+            self.recording.save(self.record_path)
+            self.recording = None
+
+    def reset_world(self):
+        # Monedas, enemigos y power-ups a su estado inicial (rejillas incluidas)
+        for coin in self.coins:
+            self.respawn_coin(coin)
+        if self.swarm is not None:
+            self.swarm.respawn()
+        else:
+            for enemy in self.enemies:
+                enemy.respawn()
+                self.enemy_grid.move(enemy)
+        for powerup in self.powerups:
+            self.despawn_powerup(powerup)
+
     def handle_events(self):
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
@@ -506,6 +1200,10 @@ class Game:
                     self.sounds.toggle_mute()
 
                 if self.state.is_menu():
+                    # Mientras se precarga, el menú no responde: crear los
+                    # sprites esperaría al hilo y la ventana se quedaría colgada
+                    if not assets.is_ready():
+                        continue
                     if event.key == pygame.K_1:
                         self.set_enemy_mode("HUMAN")
                     if event.key == pygame.K_2:
@@ -546,15 +1244,36 @@ class Game:
                         self.running = False
                         self.stop_music_if_needed()
 
-    def update(self):
+    def step(self, keys):
+        # Un paso fijo de simulación: lógica + avance del reloj del juego
+        if self.recording is not None:
+            if self.state.is_playing() or self.state.is_paused():
+                self.recording.record(keys, paused=self.state.is_paused())
+            else:
+                self.finish_recording()
+
+        self.update(keys)
+        game_clock.advance(self.step_ms)
+
+    def update(self, keys):
         if not self.state.is_playing():
             return
 
         self.maybe_spawn_powerup()
-        self.powerup.update()
-
-        self.player.update(self.width, self.height)
-        self.enemy.update(self.width, self.height, player=self.player, coin=self.coin)
+        for powerup in self.powerups:
+            if powerup.active:
+                powerup.update()
+                if not powerup.active:
+                    self.powerup_grid.remove(powerup)
+
+        self.player.update(self.width, self.height, keys)
+        target_coin = self.coins[0] if self.coins else None
+        if self.swarm is not None:
+            self.swarm.update(self.width, self.height, player=self.player, coin=target_coin)
+        else:
+            for enemy in self.enemies:
+                enemy.update(self.width, self.height, keys, player=self.player, coin=target_coin)
+                self.enemy_grid.move(enemy)
 
         self.check_coin_pickup()
         self.check_powerup_pickup()
@@ -565,31 +1284,28 @@ class Game:
             self.stop_music_if_needed()
 
     def check_coin_pickup(self):
-        if pygame.sprite.collide_rect(self.player, self.coin):
+        for coin in self.coin_grid.query(self.player.rect):
             self.score.add(1)
-            self.coin.respawn()
+            self.respawn_coin(coin)
 
     def check_powerup_pickup(self):
-        if not self.powerup.active:
-            return
-        if pygame.sprite.collide_rect(self.player, self.powerup):
+        for powerup in self.powerup_grid.query(self.player.rect):
             self.player.set_invincible(3000)  # 3 segundos
-            self.powerup.despawn()
+            self.despawn_powerup(powerup)
 
     def check_player_hit(self):
         if self.player.is_invincible():
             return
-        if pygame.sprite.collide_rect(self.enemy, self.player):
+        if self.swarm is not None:
+            hit = self.swarm.collides(self.player.rect)
+        else:
+            hit = bool(self.enemy_grid.query(self.player.rect))
+        if hit:
             self.player.lives.lose_one()
             self.player.respawn()
-            self.enemy.respawn()
-            self.coin.respawn()
-            self.powerup.despawn()
+            self.reset_world()
 
     def draw(self):
-        self.screen.fill((0, 0, 0))  # verde claro
-
-
         if self.state.is_menu():
             self.draw_menu()
         elif self.state.is_playing():
@@ -602,82 +1318,164 @@ class Game:
         elif self.state.is_game_over():
             self.draw_game_over()
 
-        pygame.display.flip()
+        self.renderer.present()
 
     def draw_world(self):
-        self.screen.blit(self.player.image, self.player.rect)
-        if self.enemy:
-            self.screen.blit(self.enemy.image, self.enemy.rect)
-        self.screen.blit(self.coin.image, self.coin.rect)
-        if self.powerup.active:
-            self.screen.blit(self.powerup.image, self.powerup.rect)
+        self.renderer.blit(self.player.image, self.player.rect)
+        for enemy in self.enemies:
+            self.renderer.blit(enemy.image, enemy.rect)
+        for coin in self.coins:
+            self.renderer.blit(coin.image, coin.rect)
+        for powerup in self.powerups:
+            if powerup.active:
+                self.renderer.blit(powerup.image, powerup.rect)
 
     def draw_hud(self):
-        self.score.draw(self.screen)
-        self.player.lives.draw(self.screen)
+        self.score.draw(self.renderer)
+        self.player.lives.draw(self.renderer)
 
         mute_state = "ON" if self.sounds.muted else "OFF"
         inv = "SÍ" if self.player.is_invincible() else "NO"
-        txt = self.font.render(f"Mute: {mute_state} (M) | Invencible: {inv}", True, (200, 200, 200))
-        self.screen.blit(txt, (10, self.height - 90))
+        txt = text_cache.render(self.font, f"Mute: {mute_state} (M) | Invencible: {inv}", (200, 200, 200))
+        self.renderer.blit(txt, (10, self.height - 90))
 
         if self.enemy_mode == "HUMAN":
             mode = "Enemigo HUMANO (WASD)"
         else:
             target = "Jugador (J)" if self.auto_target_mode == "PLAYER" else "Moneda (C)"
             mode = f"Enemigo AUTO | Objetivo: {target}"
-        txt2 = self.font.render(mode, True, (200, 200, 200))
-        self.screen.blit(txt2, (10, self.height - 60))
+        txt2 = text_cache.render(self.font, mode, (200, 200, 200))
+        self.renderer.blit(txt2, (10, self.height - 60))
 
-        txt3 = self.font.render("Jugador: Flechas | P: Pausa | ESC: Menú", True, (200, 200, 200))
-        self.screen.blit(txt3, (10, self.height - 30))
+        txt3 = text_cache.render(self.font, "Jugador: Flechas | P: Pausa | ESC: Menú", (200, 200, 200))
+        self.renderer.blit(txt3, (10, self.height - 30))
 
     def draw_pause_overlay(self):
-        overlay = self.big_font.render("PAUSA", True, (240, 240, 240))
-        self.screen.blit(overlay, (self.width // 2 - overlay.get_width() // 2, 220))
+        overlay = text_cache.render(self.big_font, "PAUSA", (240, 240, 240))
+        self.renderer.blit(overlay, (self.width // 2 - overlay.get_width() // 2, 220))
 
     def draw_menu(self):
-        title = self.big_font.render("RECOGE EL PUNTO", True, (240, 240, 240))
-        self.screen.blit(title, (self.width // 2 - title.get_width() // 2, 110))
+        title = text_cache.render(self.big_font, "RECOGE EL PUNTO", (240, 240, 240))
+        self.renderer.blit(title, (self.width // 2 - title.get_width() // 2, 110))
 
-        opt1 = self.font.render("1) Enemigo humano (WASD)", True, (220, 220, 220))
-        opt2 = self.font.render("2) Enemigo automático", True, (220, 220, 220))
-        self.screen.blit(opt1, (self.width // 2 - opt1.get_width() // 2, 240))
-        self.screen.blit(opt2, (self.width // 2 - opt2.get_width() // 2, 280))
+        opt1 = text_cache.render(self.font, "1) Enemigo humano (WASD)", (220, 220, 220))
+        opt2 = text_cache.render(self.font, "2) Enemigo automático", (220, 220, 220))
+        self.renderer.blit(opt1, (self.width // 2 - opt1.get_width() // 2, 240))
+        self.renderer.blit(opt2, (self.width // 2 - opt2.get_width() // 2, 280))
 
-        optj = self.font.render("J) IA persigue al jugador", True, (220, 220, 220))
-        optc = self.font.render("C) IA persigue la moneda", True, (220, 220, 220))
-        self.screen.blit(optj, (self.width // 2 - optj.get_width() // 2, 340))
-        self.screen.blit(optc, (self.width // 2 - optc.get_width() // 2, 380))
+        optj = text_cache.render(self.font, "J) IA persigue al jugador", (220, 220, 220))
+        optc = text_cache.render(self.font, "C) IA persigue la moneda", (220, 220, 220))
+        self.renderer.blit(optj, (self.width // 2 - optj.get_width() // 2, 340))
+        self.renderer.blit(optc, (self.width // 2 - optc.get_width() // 2, 380))
 
         selected_enemy = "Ninguno" if self.enemy_mode is None else self.enemy_mode
         selected_target = "Jugador" if self.auto_target_mode == "PLAYER" else "Moneda"
-        info = self.font.render(f"Seleccionado: {selected_enemy} | Objetivo IA: {selected_target}", True, (255, 220, 60))
-        self.screen.blit(info, (self.width // 2 - info.get_width() // 2, 460))
+        info = text_cache.render(self.font, f"Seleccionado: {selected_enemy} | Objetivo IA: {selected_target}", (255, 220, 60))
+        self.renderer.blit(info, (self.width // 2 - info.get_width() // 2, 460))
 
-        start = self.font.render("Enter: empezar (música comienza) | M: mute", True, (200, 200, 200))
-        self.screen.blit(start, (self.width // 2 - start.get_width() // 2, 520))
+        if assets.is_ready():
+            start = text_cache.render(self.font, "Enter: empezar (música comienza) | M: mute", (200, 200, 200))
+        else:
+            start = text_cache.render(self.font, f"Cargando recursos... {int(assets.progress() * 100)}%", (200, 200, 200))
+        self.renderer.blit(start, (self.width // 2 - start.get_width() // 2, 520))
 
     def draw_game_over(self):
-        title = self.big_font.render("GAME OVER", True, (255, 120, 120))
-        self.screen.blit(title, (self.width // 2 - title.get_width() // 2, 160))
+        title = text_cache.render(self.big_font, "GAME OVER", (255, 120, 120))
+        self.renderer.blit(title, (self.width // 2 - title.get_width() // 2, 160))
 
-        score = self.font.render(f"Puntuación final: {self.score.points}", True, (240, 240, 240))
-        self.screen.blit(score, (self.width // 2 - score.get_width() // 2, 250))
+        score = text_cache.render(self.font, f"Puntuación final: {self.score.points}", (240, 240, 240))
+        self.renderer.blit(score, (self.width // 2 - score.get_width() // 2, 250))
 
-        hint = self.font.render("R: reiniciar | ESC: salir | M: mute", True, (220, 220, 220))
-        self.screen.blit(hint, (self.width // 2 - hint.get_width() // 2, 340))
+        hint = text_cache.render(self.font, "R: reiniciar | ESC: salir | M: mute", (220, 220, 220))
+        self.renderer.blit(hint, (self.width // 2 - hint.get_width() // 2, 340))
 
     def run(self):
+        accumulator = 0.0
         while self.running:
             self.handle_events()
-            self.update()
+
+            if not self.world_built and assets.is_ready():
+                self.build_world()
+
+            accumulator += self.clock.tick(self.fps)
+            keys = pygame.key.get_pressed()
+            steps = 0
+            while accumulator >= self.step_ms and steps < self.max_steps_per_frame:
+                self.step(keys)
+                accumulator -= self.step_ms
+                steps += 1
+            if accumulator >= self.step_ms:
+                # Aún quedan pasos tras max_steps_per_frame: demasiado retraso,
+                # lo descartamos en vez de ir a cámara rápida
+                accumulator = 0.0
+
             self.draw()
-            self.clock.tick(self.fps)
 
+        self.finish_recording()
         self.stop_music_if_needed()
         pygame.quit()
 
+    def run_headless(self, frames, enemy_mode="AUTO", controller=None):
+        # Simula sin ventana, sin draw() y sin esperar al reloj real.
+        # controller(game, frame) devuelve las teclas pulsadas en ese paso
+        # (iterable de pygame.K_*). Devuelve el número de pasos simulados.
+        self.set_enemy_mode(enemy_mode)
+        self.start_game()
+
+        frame = 0
+        while self.running and frame < frames and not self.state.is_game_over():
+            pressed = controller(self, frame) if controller else ()
+            self.step(KeySnapshot(pressed))
+            frame += 1
+        return frame
+
+    def run_replay(self, log):
+        # Reproduce en headless una partida grabada con InputLog.
+        # El Game debe crearse con los mismos num_coins/num_enemies/num_powerups
+        # (ver replay_game). Devuelve el número de pasos simulados.
+        self.auto_target_mode = log.target_mode
+        self.set_enemy_mode(log.enemy_mode)
+        game_clock.ms = log.start_ms
+        self.start_game(session_seed=log.seed)
+
+        for frame in range(len(log.masks)):
+            if not self.running or self.state.is_game_over():
+                return frame
+            paused = log.paused_at(frame)
+            self.state.set_state(StateManager.PAUSED if paused else StateManager.PLAYING)
+            self.step(log.keys_at(frame))
+        return len(log.masks)
+
+
+def replay_game(path, swarm=False):
+    log = InputLog.load(path)
+    game = Game(headless=True, num_coins=log.num_coins, num_enemies=log.num_enemies,
+                num_powerups=log.num_powerups, swarm=swarm)
+    frames = game.run_replay(log)
+    return game, frames
+
+
+def arg_value(name, default=None):
+    if name in sys.argv:
+        i = sys.argv.index(name)
+        if i + 1 < len(sys.argv):
+            return sys.argv[i + 1]
+    return default
+
 
 if __name__ == "__main__":
-    Game().run()
+    # python recogePunto7.py --headless 10000  -> simulación rápida sin ventana
+    # python recogePunto7.py --record partida.rp7 -> graba la última partida
+    # python recogePunto7.py --replay partida.rp7 -> la reproduce sin ventana
+    if len(sys.argv) > 2 and sys.argv[1] == "--headless":
+        game = Game(headless=True)
+        frames = game.run_headless(int(sys.argv[2]))
+        print(f"Pasos simulados: {frames} | Puntuación: {game.score.points} | Vidas: {game.player.lives.lives}")
+        pygame.quit()
+    elif arg_value("--replay"):
+        game, frames = replay_game(arg_value("--replay"))
+        print(f"Pasos reproducidos: {frames} | Puntuación: {game.score.points} | Vidas: {game.player.lives.lives}")
+        pygame.quit()
+    else:
+        # --full-flip: desactiva los rects sucios (equipos donde update(rects) va peor)
+        Game(dirty_rects="--full-flip" not in sys.argv, record_path=arg_value("--record")).run()
@@ -1,5 +1,9 @@
 import pygame
 import random
+import os
+import sys
+import struct
+import hashlib
 
 # ---------------------------
 # Configuración
@@ -12,32 +16,171 @@ VEL_JUGADOR = 5
 
 RAD_OBJETO = 10
 
+CANALES_SONIDO = 8
+
+CACHE_IMAGENES = ".cache_imagenes"
+
+# Imágenes del juego: (ruta, tamaño final o divisor, con transparencia)
+IMAGENES = {
+    "fondo": ("fondo.jpg", (ANCHO, ALTO), False),
+    "alonso": ("nano1.png", 9, True),
+    "podio": ("33.png", 7, True),
+}
+
+
+# ---------------------------
+# Caché de imágenes ya escaladas
+# - Clave: ruta, fecha de modificación y tamaño del original + tamaño
+#   pedido + formato (con os.stat basta; no hay que leer el original).
+# - Se guardan los píxeles en bruto: en un arranque en caliente no hay
+#   que decodificar JPEG/PNG ni escalar, solo leer y convertir.
+# - Un fichero de caché incompleto o corrupto se descarta y se rehace.
+#   Se escribe en un temporal y se renombra: nunca queda a medias.
+# ---------------------------
+CABECERA_CACHE = struct.Struct("<4sII4s")
+
+tobytes = getattr(pygame.image, "tobytes", pygame.image.tostring)
+frombytes = getattr(pygame.image, "frombytes", pygame.image.fromstring)
+
+
+def ruta_cache(ruta, escala, alpha):
+    info = os.stat(ruta)
+    clave = f"{os.path.abspath(ruta)}|{info.st_mtime_ns}|{info.st_size}"
+    huella = hashlib.sha1(clave.encode("utf-8")).hexdigest()[:16]
+    if isinstance(escala, tuple):
+        tam = f"{escala[0]}x{escala[1]}"
+    else:
+        tam = f"div{escala}"
+    formato = "RGBA" if alpha else "RGB"
+    return os.path.join(CACHE_IMAGENES, f"{huella}_{tam}_{formato}.raw")
+
+
+def escalar_imagen(ruta, escala, alpha):
+    imagen = pygame.image.load(ruta)
+    if pygame.display.get_surface() is not None:
+        imagen = imagen.convert_alpha() if alpha else imagen.convert()
+    if isinstance(escala, tuple):
+        tamaño = escala
+    else:
+        tamaño = (imagen.get_width() // escala, imagen.get_height() // escala)
+    return pygame.transform.scale(imagen, tamaño)
+
+
+def leer_cache(cache, formato):
+    # None si el fichero no es una imagen completa del formato pedido
+    with open(cache, "rb") as f:
+        datos = f.read()
+    if len(datos) < CABECERA_CACHE.size:
+        return None
+    magic, w, h, fmt = CABECERA_CACHE.unpack_from(datos)
+    if magic != b"IMG1" or fmt.rstrip(b"\0") != formato.encode():
+        return None
+    if len(datos) - CABECERA_CACHE.size != w * h * len(formato):
+        return None
+    return frombytes(datos[CABECERA_CACHE.size:], (w, h), formato)
+
+
+def cargar_imagen(ruta, escala, alpha=True):
+    cache = ruta_cache(ruta, escala, alpha)
+    formato = "RGBA" if alpha else "RGB"
+
+    imagen = None
+    if os.path.exists(cache):
+        imagen = leer_cache(cache, formato)
+
+    if imagen is None:
+        # Arranque en frío (o caché dañada): decodificar, escalar y guardar
+        imagen = escalar_imagen(ruta, escala, alpha)
+        os.makedirs(CACHE_IMAGENES, exist_ok=True)
+        temporal = f"{cache}.{os.getpid()}.tmp"
+        with open(temporal, "wb") as f:
+            w, h = imagen.get_size()
+            f.write(CABECERA_CACHE.pack(b"IMG1", w, h, formato.encode()))
+            f.write(tobytes(imagen, formato))
+        os.replace(temporal, cache)
+
+    if pygame.display.get_surface() is not None:
+        imagen = imagen.convert_alpha() if alpha else imagen.convert()
+    return imagen
+
+
+def construir_cache():
+    # Paso de build: deja todas las imágenes del juego escaladas en la caché
+    for ruta, escala, alpha in IMAGENES.values():
+        cargar_imagen(ruta, escala, alpha)
+
+
+# ---------------------------
+# Banco de sonidos
+# - El mixer se inicia una sola vez.
+# - Los clips se decodifican al cargar, no al reproducir.
+# - play() no bloquea: usa un canal libre del pool (o el más antiguo).
+# ---------------------------
+class SoundBank:
+    def __init__(self, canales=CANALES_SONIDO):
+        self.sonidos = {}
+        self.canales = []
+        self.siguiente = 0
+
+        try:
+            if not pygame.mixer.get_init():
+                pygame.mixer.init()
+            pygame.mixer.set_num_channels(canales)
+            pygame.mixer.set_reserved(canales)
+            self.canales = [pygame.mixer.Channel(i) for i in range(canales)]
+        except pygame.error:
+            pass  # sin tarjeta de sonido: el juego sigue, mudo
+
+    def load(self, nombre, ruta):
+        if not self.canales:
+            return
+        try:
+            self.sonidos[nombre] = pygame.mixer.Sound(ruta)
+        except (pygame.error, FileNotFoundError):
+            pass
+
+    def play(self, nombre):
+        sonido = self.sonidos.get(nombre)
+        if sonido is None:
+            return
+
+        # Primero un canal libre; si todos suenan, se corta el más antiguo
+        n = len(self.canales)
+        indice = self.siguiente
+        for i in range(n):
+            j = (self.siguiente + i) % n
+            if not self.canales[j].get_busy():
+                indice = j
+                break
+        self.canales[indice].play(sonido)
+        self.siguiente = (indice + 1) % n
+
 
 def main():
+    # Buffer pequeño: menos retardo entre la colisión y el sonido
+    pygame.mixer.pre_init(44100, -16, 2, 512)
     pygame.init()
     pantalla = pygame.display.set_mode((1300, 800))
     pygame.display.set_caption("África Galindo")
     
-    fondo = pygame.image.load("fondo.jpg").convert()
-    fondo = pygame.transform.scale(fondo, (ANCHO, ALTO))
+    fondo = cargar_imagen(*IMAGENES["fondo"])
     
     reloj = pygame.time.Clock()
     fuente = pygame.font.SysFont(None, 36)
 
+    sonidos = SoundBank()
+    sonidos.load("recoger", "corresto.mp3")
+
 
 
     # Jugador como rectángulo
-    alonso = pygame.image.load("nano1.png").convert_alpha()
-    alonso = pygame.transform.scale(
-        alonso, (alonso.get_width()  // 9, alonso.get_height() // 9))
+    alonso = cargar_imagen(*IMAGENES["alonso"])
     rect_alonso = alonso.get_rect(center=(600, 200))
 
     
 
 
-    podio = pygame.image.load("33.png").convert_alpha()
-    podio = pygame.transform.scale(
-        podio, (podio.get_width()  // 7, podio.get_height() // 7))
+    podio = cargar_imagen(*IMAGENES["podio"])
     rect_podio = podio.get_rect(center=(800, 700))
 
 
@@ -83,9 +226,7 @@ def main():
 
         if rect_alonso.colliderect(rect_podio):
             puntuacion += 1
-            pygame.mixer.init()
-            sonido = pygame.mixer.Sound("corresto.mp3")
-            sonido.play()
+            sonidos.play("recoger")
             rect_podio.x = random.randint(0, min(ANCHO - rect_podio.width, rect_podio.x))
             rect_podio.y = random.randint(0, min(ALTO - rect_podio.height, rect_podio.y))
 
@@ -115,4 +256,8 @@ def main():
     pygame.quit()
 
 if __name__ == "__main__":
-    main()
+    # python ejercicio2.py --build-cache  -> prepara la caché sin abrir el juego
+    if "--build-cache" in sys.argv:
+        construir_cache()
+    else:
+        main()
@@ -1,7 +1,13 @@
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import ttk, messagebox, filedialog
 import pygame
 import math
+import csv
+import time
+from reloj_simulacion import RelojSimulacion
+from registro_camiones import RegistroCamiones
+from importar_camiones import ImportadorCamiones, ResumenImportacion
+from vista_mundo import VistaMundo
 
 # -----------------------------
 # CLASES PROPORCIONADAS
@@ -63,7 +69,7 @@ class Caja:
 pygame.init()
 pygame.mixer.music.load("claxon.mp3")
 
-camiones = []
+registro = RegistroCamiones()
 camion_activo = None
 
 root = tk.Tk()
@@ -74,9 +80,27 @@ root.geometry("1200x700")
 canvas = tk.Canvas(root, width=800, height=650, bg="white")
 canvas.pack(side="left", padx=10, pady=10)
 
-# Diccionario: matricula → rectángulo en pantalla
-rectangulos = {}
-textos = {}
+ANCHO_CANVAS, ALTO_CANVAS = 800, 650
+ANCHO_CAMION, ALTO_CAMION = 80, 40
+# Los camiones circulan por un mundo mayor que el canvas: rueda = zoom, arrastrar = mover
+ANCHO_MUNDO, ALTO_MUNDO = 8000, 6500
+vista = VistaMundo(ANCHO_MUNDO, ALTO_MUNDO, ANCHO_CANVAS, ALTO_CANVAS)
+
+# Camiones con velocidad: los únicos que recorre simular()
+en_marcha = set()
+# Camiones que han cambiado de posición desde el último dibujado
+movidos = set()
+# Camiones con sus items a la vista: al alejar el zoom solo se ocultan estos
+visibles = set()
+# Estado de la vista en el último dibujado (escala, x0, y0, ancho, alto)
+vista_anterior = None
+# Zoom lejano: items (óvalo, texto) de los grupos, reutilizados entre frames.
+# Si solo se mueven camiones, los grupos se recalculan cada REFRESCO_GRUPOS s
+items_grupos = []
+grupos_visibles = 0
+REFRESCO_GRUPOS = 0.25
+ultimo_grupos = 0.0
+grupos_pendientes = False
 
 # -----------------------------
 # SECCIÓN DERECHA
@@ -106,14 +130,13 @@ def crear_camion():
             int(entries["Rumbo (1-359)"].get()),
             int(entries["Velocidad"].get())
         )
-        camiones.append(nuevo)
-        lista_camiones['values'] = [c.matricula for c in camiones]
+        # Primero el registro: si la matrícula está repetida no se dibuja nada
+        entrada = registro.agregar(nuevo)
+        lista_camiones['values'] = registro.matriculas()
 
-        # Crear rectángulo en canvas
-        rect = canvas.create_rectangle(50, 50, 130, 90, fill="red")
-        texto = canvas.create_text(90, 70, text=nuevo.matricula, fill="white")
-        rectangulos[nuevo.matricula] = rect
-        textos[nuevo.matricula] = texto
+        # Los items del canvas se crean en dibujar(), si se ve de cerca
+        actualizar_marcha(entrada)
+        movidos.add(entrada)
 
         messagebox.showinfo("OK", "Camión creado correctamente")
     except Exception as e:
@@ -122,6 +145,44 @@ def crear_camion():
 btn_crear = tk.Button(frame_nuevo, text="Crear Camión", command=crear_camion)
 btn_crear.pack(pady=10)
 
+# Importación masiva: los camiones se colocan en rejilla para que no se tapen
+def posicion_rejilla(n):
+    columnas = ANCHO_MUNDO // (ANCHO_CAMION + 10)
+    filas = ALTO_MUNDO // (ALTO_CAMION + 10)
+    n %= columnas * filas
+    return (n % columnas) * (ANCHO_CAMION + 10), (n // columnas) * (ALTO_CAMION + 10)
+
+def importar_camiones():
+    ruta = filedialog.askopenfilename(
+        title="Importar camiones y cajas",
+        filetypes=[("CSV, JSON lines o JSON", "*.csv *.jsonl *.ndjson *.json"), ("Todos", "*.*")])
+    if not ruta:
+        return
+    resumen = ResumenImportacion()
+    error = None
+    try:
+        ImportadorCamiones(registro, camion, Caja).importar(ruta, posicion_rejilla, resumen)
+    except (OSError, UnicodeDecodeError, csv.Error) as e:
+        error = e
+    finally:
+        # Aunque se corte a mitad, lo ya dado de alta queda en el registro:
+        # se refresca igual. Sin items del canvas aquí: dibujar() solo crea
+        # los de los camiones que se ven de cerca. Un solo refresco del combobox.
+        for entrada in resumen.entradas:
+            actualizar_marcha(entrada)
+            movidos.add(entrada)
+        lista_camiones['values'] = registro.matriculas()
+
+    if error is not None:
+        messagebox.showerror("Error", f"Importación interrumpida: {error}\n\n{resumen}")
+    elif resumen.errores:
+        messagebox.showwarning("Importación con errores", str(resumen))
+    else:
+        messagebox.showinfo("Importación", str(resumen))
+
+btn_importar = tk.Button(frame_nuevo, text="Importar CSV / JSON...", command=importar_camiones)
+btn_importar.pack(pady=5)
+
 # Selección
 frame_ctrl = ttk.LabelFrame(panel, text="Control del Camión")
 frame_ctrl.pack(fill="x", pady=10)
@@ -134,17 +195,37 @@ info.pack(pady=10)
 
 def actualizar_info():
     global camion_activo
-    sel = lista_camiones.get()
-    for c in camiones:
-        if c.matricula == sel:
-            camion_activo = c
-            info.delete(1.0, "end")
-            info.insert("end", str(c))
-            return
+    entrada = registro.obtener(lista_camiones.get())
+    if entrada:
+        camion_activo = entrada.camion
+        info.delete(1.0, "end")
+        info.insert("end", str(camion_activo))
 
 btn_sel = tk.Button(frame_ctrl, text="Seleccionar", command=actualizar_info)
 btn_sel.pack()
 
+def eliminar_camion():
+    global camion_activo
+    sel = lista_camiones.get()
+    if sel not in registro:
+        return
+    entrada = registro.eliminar(sel)
+    if entrada.rect is not None:
+        canvas.delete(entrada.rect)
+        canvas.delete(entrada.texto)
+    en_marcha.discard(entrada)
+    movidos.discard(entrada)
+    visibles.discard(entrada)
+
+    if camion_activo is entrada.camion:
+        camion_activo = None
+        info.delete(1.0, "end")
+    lista_camiones['values'] = registro.matriculas()
+    lista_camiones.set("")
+
+btn_eliminar = tk.Button(frame_ctrl, text="Eliminar Camión", command=eliminar_camion)
+btn_eliminar.pack(pady=5)
+
 # Controles
 vel = tk.Scale(frame_ctrl, from_=0, to=200, label="Velocidad", orient="horizontal")
 vel.pack(fill="x")
@@ -156,6 +237,7 @@ def aplicar_cambios():
     if camion_activo:
         camion_activo.setVelocidad(vel.get())
         camion_activo.setRumbo(rum.get())
+        actualizar_marcha(registro.obtener(camion_activo.matricula))
         actualizar_info()
 
 btn_aplicar = tk.Button(frame_ctrl, text="Aplicar Cambios", command=aplicar_cambios)
@@ -168,29 +250,145 @@ btn_claxon.pack(pady=20)
 # -----------------------------
 # ANIMACIÓN
 # -----------------------------
-def animar():
-    for c in camiones:
-        rect = rectangulos[c.matricula]
-        texto = textos[c.matricula]
+# La simulación avanza cada 50 ms de tiempo real (aunque Tk vaya con
+# retraso) con RelojSimulacion; el canvas se redibuja tras cada paso
+# simulado, a 20 FPS.
+#
+# Solo se tocan los items de Tk de los camiones que se han movido y
+# están a la vista; los que salen de la vista se ocultan una vez y no se
+# actualizan hasta que vuelven a entrar. Con zoom lejano no hay un item
+# por camión: se dibujan grupos por celdas (VistaMundo.agrupar).
+def actualizar_marcha(entrada):
+    if entrada.camion.velocidad:
+        en_marcha.add(entrada)
+    else:
+        en_marcha.discard(entrada)
+
+def simular():
+    for entrada in en_marcha:
+        c = entrada.camion
+        pos = entrada.pos
 
         vel = c.velocidad * 0.05
         ang = math.radians(c.rumbo)
 
-        dx = vel * math.cos(ang)
-        dy = vel * math.sin(ang)
-
-        canvas.move(rect, dx, dy)
-        canvas.move(texto, dx, dy)
-
-        x1, y1, x2, y2 = canvas.coords(rect)
+        x = pos[0] + vel * math.cos(ang)
+        y = pos[1] + vel * math.sin(ang)
+
+        # Mantener dentro del mundo
+        x = max(0, min(ANCHO_MUNDO - ANCHO_CAMION, x))
+        y = max(0, min(ALTO_MUNDO - ALTO_CAMION, y))
+
+        # Parado contra el borde: no hay nada que redibujar
+        if x != pos[0] or y != pos[1]:
+            pos[0], pos[1] = x, y
+            movidos.add(entrada)
+
+def dibujar():
+    global vista_anterior
+    estado = (vista.escala, vista.x0, vista.y0, vista.ancho_px, vista.alto_px)
+    cambio = estado != vista_anterior
+    vista_anterior = estado
+
+    if vista.detalle:
+        ocultar_grupos()
+        # Si la vista ha cambiado (zoom, arrastre, tamaño) se repasan todos una vez
+        dibujar_detalle(registro if cambio else movidos)
+    else:
+        global grupos_pendientes
+        if cambio:
+            for entrada in list(visibles):
+                ocultar(entrada)
+        if movidos:
+            grupos_pendientes = True
+        if cambio or (grupos_pendientes and time.perf_counter() - ultimo_grupos >= REFRESCO_GRUPOS):
+            dibujar_grupos()
+    movidos.clear()
+
+def dibujar_detalle(pendientes):
+    x0, y0, x1, y1 = vista.rect_mundo()
+    ancho, alto = ANCHO_CAMION * vista.escala, ALTO_CAMION * vista.escala
+
+    for entrada in pendientes:
+        x, y = entrada.pos
+        if x < x1 and x + ANCHO_CAMION > x0 and y < y1 and y + ALTO_CAMION > y0:
+            if entrada.rect is None:
+                entrada.rect = canvas.create_rectangle(0, 0, 0, 0, fill="red")
+                entrada.texto = canvas.create_text(0, 0, text=entrada.camion.matricula, fill="white")
+            px, py = vista.a_pantalla(x, y)
+            canvas.coords(entrada.rect, px, py, px + ancho, py + alto)
+            canvas.coords(entrada.texto, px + ancho / 2, py + alto / 2)
+            if not entrada.visible:
+                canvas.itemconfigure(entrada.rect, state="normal")
+                canvas.itemconfigure(entrada.texto, state="normal")
+                entrada.visible = True
+                visibles.add(entrada)
+        else:
+            ocultar(entrada)
+
+def ocultar(entrada):
+    if entrada.visible and entrada.rect is not None:
+        canvas.itemconfigure(entrada.rect, state="hidden")
+        canvas.itemconfigure(entrada.texto, state="hidden")
+    entrada.visible = False
+    visibles.discard(entrada)
+
+def dibujar_grupos():
+    # Zoom lejano: un círculo por celda con el número de camiones.
+    # Los items ya creados se mueven y se reetiquetan; los que sobran se ocultan
+    global grupos_visibles, ultimo_grupos, grupos_pendientes
+    centros = ((e.pos[0] + ANCHO_CAMION / 2, e.pos[1] + ALTO_CAMION / 2) for e in registro)
+    grupos = vista.agrupar(centros)
+    for i, (px, py, n) in enumerate(grupos):
+        if i == len(items_grupos):
+            items_grupos.append((canvas.create_oval(0, 0, 0, 0, fill="red", outline="", tags="grupo"),
+                                 canvas.create_text(0, 0, fill="white", tags="grupo")))
+        oval, texto = items_grupos[i]
+        r = 6 + 3 * math.log2(n)
+        canvas.coords(oval, px - r, py - r, px + r, py + r)
+        canvas.coords(texto, px, py)
+        canvas.itemconfigure(texto, text=str(n))
+        if i >= grupos_visibles:
+            canvas.itemconfigure(oval, state="normal")
+            canvas.itemconfigure(texto, state="normal")
+    for oval, texto in items_grupos[len(grupos):grupos_visibles]:
+        canvas.itemconfigure(oval, state="hidden")
+        canvas.itemconfigure(texto, state="hidden")
+    grupos_visibles = len(grupos)
+    ultimo_grupos = time.perf_counter()
+    grupos_pendientes = False
+
+def ocultar_grupos():
+    global grupos_visibles
+    for oval, texto in items_grupos[:grupos_visibles]:
+        canvas.itemconfigure(oval, state="hidden")
+        canvas.itemconfigure(texto, state="hidden")
+    grupos_visibles = 0
+
+# Zoom con la rueda (Windows/macOS: <MouseWheel>, Linux: botones 4 y 5)
+def zoom_raton(event):
+    acercar = event.num == 4 or event.delta > 0
+    vista.zoom(1.25 if acercar else 0.8, event.x, event.y)
+
+arrastre = [0, 0]
+
+def empezar_arrastre(event):
+    arrastre[0], arrastre[1] = event.x, event.y
+
+def arrastrar(event):
+    vista.desplazar(event.x - arrastre[0], event.y - arrastre[1])
+    arrastre[0], arrastre[1] = event.x, event.y
+
+canvas.bind("<MouseWheel>", zoom_raton)
+canvas.bind("<Button-4>", zoom_raton)
+canvas.bind("<Button-5>", zoom_raton)
+canvas.bind("<ButtonPress-1>", empezar_arrastre)
+canvas.bind("<B1-Motion>", arrastrar)
+canvas.bind("<Configure>", lambda e: vista.redimensionar(e.width, e.height))
 
-        # Mantener dentro de pantalla
-        if x1 < 0: canvas.move(rect, -x1, 0); canvas.move(texto, -x1, 0)
-        if y1 < 0: canvas.move(rect, 0, -y1); canvas.move(texto, 0, -y1)
-        if x2 > 800: canvas.move(rect, 800-x2, 0); canvas.move(texto, 800-x2, 0)
-        if y2 > 650: canvas.move(rect, 0, 650-y2); canvas.move(texto, 0, 650-y2)
-
-    canvas.after(50, animar)
+def animar():
+    reloj = RelojSimulacion(canvas, simular, dibujar, paso_ms=50)
+    reloj.iniciar()
 
 animar()
 root.mainloop()
@@ -0,0 +1,124 @@
+import numpy as np
+from barco import Barco
+
+
+# =========================================================
+# FlotaBarcos: estado de todos los barcos en arrays de NumPy
+# - Una columna por atributo (posición, velocidad, rumbo, munición) y
+#   una fila por barco ("structure of arrays").
+# - avanzar() mueve todos los barcos a la vez, sin un cos/sin por barco.
+# - Cada barco es un BarcoFila: un Barco normal cuyos atributos leen y
+#   escriben su fila de la flota.
+# =========================================================
+class FlotaBarcos:
+    def __init__(self, capacidad=16):
+        self.n = 0
+        self.posicionX = np.zeros(capacidad, dtype=np.float64)
+        self.posicionY = np.zeros(capacidad, dtype=np.float64)
+        self.velocidad = np.zeros(capacidad, dtype=np.float64)
+        self.rumbo = np.zeros(capacidad, dtype=np.float64)
+        self.numeroMunicion = np.zeros(capacidad, dtype=np.int64)
+        self.barcos = []    # fila -> BarcoFila
+
+    def __len__(self):
+        return self.n
+
+    def crear(self, nombre, posicionX=0, posicionY=0, velocidad=0, rumbo=0, numeroMunicion=10):
+        return BarcoFila(self, nombre, posicionX, posicionY, velocidad, rumbo, numeroMunicion)
+
+    def reservar_fila(self, barco):
+        if self.n == len(self.posicionX):
+            self.crecer()
+        fila = self.n
+        self.n += 1
+        self.barcos.append(barco)
+        return fila
+
+    def crecer(self):
+        # Capacidad x2: añadir barcos sigue siendo O(1) amortizado
+        capacidad = max(16, len(self.posicionX) * 2)
+        for campo in BarcoFila.CAMPOS:
+            viejo = getattr(self, campo)
+            nuevo = np.zeros(capacidad, dtype=viejo.dtype)
+            nuevo[:self.n] = viejo[:self.n]
+            setattr(self, campo, nuevo)
+
+    def eliminar(self, barco):
+        # El último barco pasa a ocupar la fila del eliminado
+        fila = barco.fila
+        ultima = self.n - 1
+        for campo in BarcoFila.CAMPOS:
+            columna = getattr(self, campo)
+            columna[fila] = columna[ultima]
+
+        movido = self.barcos.pop()
+        if movido is not barco:
+            self.barcos[fila] = movido
+            movido.fila = fila
+        self.n -= 1
+        barco.flota = None
+
+    def avanzar(self, factor=1 / 5):
+        # Mismo paso que App.actualizar_posiciones, para todos los barcos.
+        # Devuelve las filas de los barcos que se han movido.
+        n = self.n
+        angulo = np.radians(self.rumbo[:n])
+        avance = self.velocidad[:n] * factor
+        self.posicionX[:n] += np.cos(angulo) * avance
+        self.posicionY[:n] += np.sin(angulo) * avance
+        return np.flatnonzero(avance)
+
+
+def columna(nombre):
+    def leer(self):
+        return getattr(self.flota, nombre)[self.fila].item()
+
+    def escribir(self, valor):
+        getattr(self.flota, nombre)[self.fila] = valor
+
+    return property(leer, escribir)
+
+
+class BarcoFila(Barco):
+    CAMPOS = ("posicionX", "posicionY", "velocidad", "rumbo", "numeroMunicion")
+
+    posicionX = columna("posicionX")
+    posicionY = columna("posicionY")
+    velocidad = columna("velocidad")
+    rumbo = columna("rumbo")
+    numeroMunicion = columna("numeroMunicion")
+
+    def __init__(self, flota, nombre, posicionX=0, posicionY=0, velocidad=0, rumbo=0, numeroMunicion=10):
+        self.flota = flota
+        self.fila = flota.reservar_fila(self)
+        super().__init__(nombre, posicionX, posicionY, velocidad, rumbo, numeroMunicion)
+
+
+# Prueba: la flota avanza igual que moviendo cada Barco por separado
+if __name__ == "__main__":
+    import time
+    from math import cos, sin, radians
+
+    flota = FlotaBarcos()
+    sueltos = []
+    for i in range(20000):
+        datos = (f"Barco{i + 1}", i % 600, i % 400, i % 21, 1 + i % 359)
+        flota.crear(*datos)
+        sueltos.append(Barco(*datos))
+
+    inicio = time.perf_counter()
+    for _ in range(100):
+        flota.avanzar()
+    t_flota = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    for _ in range(100):
+        for b in sueltos:
+            b.posicionX += cos(radians(b.rumbo)) * (b.velocidad / 5)
+            b.posicionY += sin(radians(b.rumbo)) * (b.velocidad / 5)
+    t_sueltos = time.perf_counter() - inicio
+
+    iguales = all(abs(a.posicionX - b.posicionX) < 1e-6 and abs(a.posicionY - b.posicionY) < 1e-6
+                  for a, b in zip(flota.barcos, sueltos))
+    print(f"{len(flota)} barcos x 100 pasos | flota: {t_flota * 1000:.1f} ms | "
+          f"uno a uno: {t_sueltos * 1000:.1f} ms | mismas posiciones: {iguales}")
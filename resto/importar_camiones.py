@@ -0,0 +1,166 @@
+import csv
+import json
+import os
+from itertools import islice
+
+
+# =========================================================
+# Importación masiva de camiones y cajas (CSV, JSON lines o JSON)
+# - Una fila por camión o por caja; la columna "tipo" dice cuál es.
+# - .jsonl/.ndjson: un objeto por línea. .json: un array de objetos
+#   (ese sí se carga entero; la "línea" es la posición en el array).
+#   Las cajas llevan la "matricula" del camión al que van (que puede
+#   venir antes en el mismo fichero o estar ya en el registro).
+# - El fichero se lee en streaming y se valida por lotes de `lote` filas.
+# - Una fila mala no para la importación: se apunta en el resumen
+#   (número de línea + motivo) y se sigue.
+# - No toca la interfaz: devuelve las entradas nuevas del registro para
+#   que el que llama cree todos los items del canvas de una vez.
+#
+# Columnas:
+#   camion: tipo, matricula, conductor, capacidad_kg, descripcion_carga, rumbo, velocidad
+#   caja:   tipo, matricula, codigo, peso_kg, descripcion_carga, largo, ancho, altura
+# =========================================================
+OBLIGATORIOS_CAMION = ("matricula", "conductor", "capacidad_kg", "rumbo")
+OBLIGATORIOS_CAJA = ("matricula", "codigo", "peso_kg", "largo", "ancho", "altura")
+
+
+class ResumenImportacion:
+    def __init__(self):
+        self.filas = 0
+        self.camiones = 0
+        self.cajas = 0
+        self.errores = []       # (línea, mensaje)
+        self.entradas = []      # EntradaCamion creadas en esta importación
+
+    def __str__(self):
+        texto = (f"Filas leídas: {self.filas}\n"
+                 f"Camiones creados: {self.camiones}\n"
+                 f"Cajas añadidas: {self.cajas}\n"
+                 f"Errores: {len(self.errores)}")
+        # Solo los primeros: con miles de errores el messagebox sería ilegible
+        for linea, mensaje in self.errores[:20]:
+            texto += f"\n  línea {linea}: {mensaje}"
+        if len(self.errores) > 20:
+            texto += f"\n  ... y {len(self.errores) - 20} más"
+        return texto
+
+
+def leer_filas(ruta):
+    # Devuelve (línea, fila); salvo .json, sin cargar el fichero entero en memoria
+    extension = os.path.splitext(ruta)[1].lower()
+    with open(ruta, newline="", encoding="utf-8") as f:
+        if extension == ".json":
+            try:
+                datos = json.load(f)
+            except json.JSONDecodeError as e:
+                yield e.lineno, e
+                return
+            # Un objeto suelto cuenta como una fila; lo demás lo rechaza importar_lote
+            if not isinstance(datos, list):
+                datos = [datos]
+            yield from enumerate(datos, start=1)
+        elif extension in (".jsonl", ".ndjson"):
+            for linea, texto in enumerate(f, start=1):
+                texto = texto.strip()
+                if not texto:
+                    continue
+                try:
+                    yield linea, json.loads(texto)
+                except json.JSONDecodeError as e:
+                    yield linea, e
+        else:
+            lector = csv.DictReader(f)
+            for fila in lector:
+                yield lector.line_num, fila
+
+
+class ImportadorCamiones:
+    def __init__(self, registro, clase_camion, clase_caja, lote=1000):
+        # Las clases se pasan desde fuera: CamionesYCajas_2 arranca Tk al importarse
+        self.registro = registro
+        self.clase_camion = clase_camion
+        self.clase_caja = clase_caja
+        self.lote = lote
+
+    def importar(self, ruta, posicion=None, resumen=None):
+        # posicion(n) -> (x, y) del camión que ocupa el puesto n del registro;
+        # por defecto todos en (50, 50), como los del formulario.
+        # Si se pasa el resumen, quien llama tiene las entradas ya dadas de
+        # alta aunque la lectura falle a mitad (p. ej. error de E/S)
+        if resumen is None:
+            resumen = ResumenImportacion()
+        filas = leer_filas(ruta)
+        try:
+            while True:
+                lote = list(islice(filas, self.lote))
+                if not lote:
+                    break
+                self.importar_lote(lote, resumen, posicion)
+        finally:
+            resumen.errores.sort()
+        return resumen
+
+    def importar_lote(self, lote, resumen, posicion=None):
+        # Primero se validan y construyen todos los objetos del lote;
+        # luego se dan de alta (camiones antes que cajas, por si una caja
+        # apunta a un camión que viene más abajo en el mismo lote).
+        camiones, cajas = [], []
+        for linea, fila in lote:
+            resumen.filas += 1
+            try:
+                if isinstance(fila, Exception):
+                    raise ValueError(f"JSON no válido ({fila})")
+                if not isinstance(fila, dict):
+                    raise ValueError(f"La fila no es un objeto: {type(fila).__name__}")
+                tipo = str(fila.get("tipo", "camion")).strip().lower()
+                if tipo == "camion":
+                    camiones.append((linea, self.crear_camion(fila)))
+                elif tipo == "caja":
+                    cajas.append((linea, str(fila.get("matricula", "")).strip(), self.crear_caja(fila)))
+                else:
+                    raise ValueError(f"Tipo desconocido: {tipo}")
+            except (ValueError, TypeError, KeyError) as e:
+                resumen.errores.append((linea, str(e)))
+
+        for linea, nuevo in camiones:
+            try:
+                x, y = posicion(len(self.registro)) if posicion else (50, 50)
+                resumen.entradas.append(self.registro.agregar(nuevo, x, y))
+                resumen.camiones += 1
+            except ValueError as e:
+                resumen.errores.append((linea, str(e)))
+
+        for linea, matricula, caja in cajas:
+            entrada = self.registro.obtener(matricula)
+            if entrada is None:
+                resumen.errores.append((linea, f"No existe el camión {matricula!r} para la caja {caja.codigo}"))
+                continue
+            entrada.camion.AñadirCaja(caja)
+            resumen.cajas += 1
+
+    def crear_camion(self, fila):
+        faltan = [c for c in OBLIGATORIOS_CAMION if fila.get(c) in (None, "")]
+        if faltan:
+            raise ValueError(f"Faltan campos: {', '.join(faltan)}")
+        return self.clase_camion(
+            str(fila["matricula"]).strip(),
+            str(fila["conductor"]).strip(),
+            float(fila["capacidad_kg"]),
+            str(fila.get("descripcion_carga") or ""),
+            int(fila["rumbo"]),
+            int(fila.get("velocidad") or 0),
+        )
+
+    def crear_caja(self, fila):
+        faltan = [c for c in OBLIGATORIOS_CAJA if fila.get(c) in (None, "")]
+        if faltan:
+            raise ValueError(f"Faltan campos: {', '.join(faltan)}")
+        return self.clase_caja(
+            str(fila["codigo"]).strip(),
+            float(fila["peso_kg"]),
+            str(fila.get("descripcion_carga") or ""),
+            float(fila["largo"]),
+            float(fila["ancho"]),
+            float(fila["altura"]),
+        )
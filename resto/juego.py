@@ -1,8 +1,8 @@
 import tkinter as tk
 from tkinter import messagebox
 import pygame
-from math import cos, sin, radians
-from barco import Barco  
+from flota_barcos import FlotaBarcos
+from reloj_simulacion import RelojSimulacion
 
 class App:
     def __init__(self, root):
@@ -19,8 +19,14 @@ class App:
         self.canvas = tk.Canvas(root, bg="lightblue", width=600, height=400)
         self.canvas.pack(pady=10)
 
+        # Estado de todos los barcos en arrays (cada Barco es una fila)
+        self.flota = FlotaBarcos()
         self.barcos = []
         self.barco_activo = None
+        # Barco -> (óvalo, texto): los items del canvas se crean una vez y se mueven
+        self.items = {}
+        # Barcos movidos desde el último dibujado
+        self.movidos = set()
 
         tk.Button(root, text="Crear Barco", command=self.crear_barco).pack(pady=5)
         self.selector = tk.StringVar()
@@ -34,17 +40,25 @@ class App:
         tk.Button(control_frame, text="Disminuir Velocidad", command=lambda: self.cambiar_velocidad(-1)).grid(row=0, column=2, padx=5)
         tk.Button(control_frame, text="Cambiar Rumbo", command=self.cambiar_rumbo).grid(row=0, column=3, padx=5)
 
-        self.actualizar_posiciones()
+        # Simulación a 10 pasos/s (como antes); se dibuja tras cada paso, también a 10 FPS
+        self.reloj = RelojSimulacion(root, self.actualizar_posiciones, self.dibujar_movidos, paso_ms=100)
+        self.reloj.iniciar()
 
     def crear_barco(self):
         nombre = f"Barco{len(self.barcos) + 1}"
-        nuevo = Barco(nombre)
+        nuevo = self.flota.crear(nombre)
         self.barcos.append(nuevo)
+        self.dibujar_barco(nuevo)
         self.selector.set(nombre)
         self.actualizar_selector()
         self.barco_activo = nuevo
         print(f"{nombre} creado")
 
+    def dibujar_barco(self, b):
+        oval = self.canvas.create_oval(b.posicionX, b.posicionY, b.posicionX + 20, b.posicionY + 20, fill="navy")
+        texto = self.canvas.create_text(b.posicionX + 10, b.posicionY - 10, text=b.nombre, fill="black")
+        self.items[b] = (oval, texto)
+
     def actualizar_selector(self):
         menu = self.menu_barcos["menu"]
         menu.delete(0, "end")
@@ -80,13 +94,17 @@ class App:
             messagebox.showwarning("Atención", "Selecciona un barco")
 
     def actualizar_posiciones(self):
-        self.canvas.delete("all")
-        for b in self.barcos:
-            b.posicionX += cos(radians(b.rumbo)) * (b.velocidad / 5)
-            b.posicionY += sin(radians(b.rumbo)) * (b.velocidad / 5)
-            self.canvas.create_oval(b.posicionX, b.posicionY, b.posicionX + 20, b.posicionY + 20, fill="navy")
-            self.canvas.create_text(b.posicionX + 10, b.posicionY - 10, text=b.nombre, fill="black")
-        self.root.after(100, self.actualizar_posiciones)
+        # Un paso de simulación (lo llama RelojSimulacion cada 100 ms de tiempo real)
+        for fila in self.flota.avanzar(1 / 5):
+            self.movidos.add(self.flota.barcos[fila])
+
+    def dibujar_movidos(self):
+        # Solo se tocan los items de los barcos que se han movido
+        for b in self.movidos:
+            oval, texto = self.items[b]
+            self.canvas.coords(oval, b.posicionX, b.posicionY, b.posicionX + 20, b.posicionY + 20)
+            self.canvas.coords(texto, b.posicionX + 10, b.posicionY - 10)
+        self.movidos.clear()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,197 @@
+import numpy as np
+
+
+# =========================================================
+# Planificador de carga: reparte cajas entre camiones en 3D
+# - First-fit decreasing: las cajas se colocan de mayor a menor volumen,
+#   cada una en el primer camión (en orden) donde cabe.
+# - Dentro de cada camión, espacios libres por cortes de guillotina:
+#   al colocar una caja en la esquina de un hueco, lo que sobra se parte
+#   en tres huecos (delante, al lado y encima) que no se solapan entre
+#   sí. Así no hace falta comprobar choques contra las cajas ya puestas.
+# - Las cajas pueden girarse en horizontal (largo <-> ancho), nunca
+#   tumbarse: la altura siempre queda hacia arriba.
+# - Nunca se pasa de capacidad_kg, contando también el peso de las cajas
+#   que el camión ya lleva (camion.cajas, p. ej. las importadas).
+# - De esas cajas previas no se sabe dónde van: el plan supone su volumen
+#   libre y coloca en el camión entero. Si importa, planificar solo con
+#   camiones vacíos.
+# - Para no probar 1000 camiones por caja, el peso libre y el mayor hueco
+#   de cada camión están en arrays de NumPy y se filtran de una vez.
+#
+# Medidas en las mismas unidades que Caja (cm); por defecto la caja de
+# un semirremolque (13,6 x 2,45 x 2,7 m).
+# =========================================================
+DIMENSIONES_CAMION = (1360.0, 245.0, 270.0)
+
+
+class Colocacion:
+    def __init__(self, caja, camion, x, y, z, largo, ancho, altura):
+        self.caja = caja
+        self.camion = camion
+        self.x, self.y, self.z = x, y, z                # esquina (x: largo, y: ancho, z: altura)
+        self.largo, self.ancho, self.altura = largo, ancho, altura
+
+    @property
+    def girada(self):
+        return self.largo != self.caja.largo
+
+    def __str__(self):
+        return (f"Caja {self.caja.codigo} -> {self.camion.matricula} "
+                f"en ({self.x:g}, {self.y:g}, {self.z:g})"
+                f"{' girada' if self.girada else ''}")
+
+
+def peso_cargado(camion):
+    # Peso de las cajas que el camión ya lleva antes de planificar
+    return sum(c.peso_kg for c in camion.cajas)
+
+
+class PlanCarga:
+    def __init__(self, camiones):
+        self.camiones = camiones
+        self.colocaciones = {c.matricula: [] for c in camiones}
+        self.sin_asignar = []
+
+    def peso(self, camion):
+        return sum(p.caja.peso_kg for p in self.colocaciones[camion.matricula])
+
+    def colocadas(self):
+        return sum(len(lista) for lista in self.colocaciones.values())
+
+    def aplicar(self):
+        # Mete las cajas en los camiones con AñadirCaja, en orden de carga
+        for c in self.camiones:
+            for p in self.colocaciones[c.matricula]:
+                c.AñadirCaja(p.caja)
+
+    def comprobar(self, dimensiones=DIMENSIONES_CAMION):
+        # Dentro del camión, sin solapes y sin pasarse de peso
+        L, W, H = dimensiones
+        for c in self.camiones:
+            lista = self.colocaciones[c.matricula]
+            if peso_cargado(c) + self.peso(c) > c.capacidad_kg + 1e-9:
+                raise AssertionError(f"{c.matricula}: sobrepeso")
+            if not lista:
+                continue
+            a = np.array([(p.x, p.y, p.z, p.x + p.largo, p.y + p.ancho, p.z + p.altura) for p in lista])
+            if (a[:, :3] < -1e-9).any() or (a[:, 3:] > np.array([L, W, H]) + 1e-9).any():
+                raise AssertionError(f"{c.matricula}: caja fuera del camión")
+            choque = ((a[:, None, 0] < a[None, :, 3] - 1e-9) & (a[None, :, 0] < a[:, None, 3] - 1e-9) &
+                      (a[:, None, 1] < a[None, :, 4] - 1e-9) & (a[None, :, 1] < a[:, None, 4] - 1e-9) &
+                      (a[:, None, 2] < a[None, :, 5] - 1e-9) & (a[None, :, 2] < a[:, None, 5] - 1e-9))
+            np.fill_diagonal(choque, False)
+            if choque.any():
+                raise AssertionError(f"{c.matricula}: cajas solapadas")
+
+
+class PlanificadorCarga:
+    def __init__(self, camiones, dimensiones=DIMENSIONES_CAMION):
+        self.camiones = list(camiones)
+        self.dimensiones = tuple(float(d) for d in dimensiones)
+        self.plan = PlanCarga(self.camiones)
+
+        L, W, H = self.dimensiones
+        n = len(self.camiones)
+        self.kg_libres = np.array([c.capacidad_kg - peso_cargado(c) for c in self.camiones], dtype=np.float64)
+        self.hueco_max = np.full(n, L * W * H)          # volumen del mayor hueco libre
+        self.huecos = [[(0.0, 0.0, 0.0, L, W, H)] for _ in range(n)]
+        self.minimos = (0.0, 0.0)                        # huecos más pequeños no valen para nada
+        # Los huecos solo se parten, nunca crecen: si unas medidas no caben en
+        # el camión i, ya no cabrán nunca. Por medidas, camiones descartados.
+        self.descartados = {}
+
+    def planificar(self, cajas):
+        cajas = sorted(cajas, key=lambda c: c.largo * c.ancho * c.altura, reverse=True)
+        if cajas:
+            self.minimos = (min(min(c.largo, c.ancho) for c in cajas), min(c.altura for c in cajas))
+
+        for caja in cajas:
+            if not self.colocar(caja):
+                self.plan.sin_asignar.append(caja)
+        return self.plan
+
+    def colocar(self, caja):
+        volumen = caja.largo * caja.ancho * caja.altura
+        medidas = (min(caja.largo, caja.ancho), max(caja.largo, caja.ancho), caja.altura)
+        descartados = self.descartados.get(medidas)
+        if descartados is None:
+            descartados = self.descartados[medidas] = np.zeros(len(self.camiones), dtype=bool)
+
+        libres = (self.kg_libres >= caja.peso_kg) & (self.hueco_max >= volumen) & ~descartados
+        for i in np.flatnonzero(libres):
+            if self.colocar_en(i, caja):
+                return True
+            descartados[i] = True
+        return False
+
+    def colocar_en(self, i, caja):
+        huecos = self.huecos[i]
+        for orientacion in ((caja.largo, caja.ancho), (caja.ancho, caja.largo)):
+            l, w = orientacion
+            h = caja.altura
+            for k, (x, y, z, L, W, H) in enumerate(huecos):
+                if l <= L and w <= W and h <= H:
+                    break
+            else:
+                continue
+
+            # El hueco se parte en: delante (todo lo que queda a lo largo),
+            # al lado (a lo ancho, solo hasta donde llega la caja) y encima
+            huecos[k] = huecos[-1]
+            huecos.pop()
+            self.nuevo_hueco(huecos, x + l, y, z, L - l, W, H)
+            self.nuevo_hueco(huecos, x, y + w, z, l, W - w, H)
+            self.nuevo_hueco(huecos, x, y, z + h, l, w, H - h)
+
+            self.kg_libres[i] -= caja.peso_kg
+            self.hueco_max[i] = max((a * b * c for _, _, _, a, b, c in huecos), default=0.0)
+            camion = self.camiones[i]
+            self.plan.colocaciones[camion.matricula].append(Colocacion(caja, camion, x, y, z, l, w, h))
+            return True
+        return False
+
+    def nuevo_hueco(self, huecos, x, y, z, L, W, H):
+        lado_min, alto_min = self.minimos
+        if min(L, W) >= lado_min and H >= alto_min and L > 0 and W > 0 and H > 0:
+            huecos.append((x, y, z, L, W, H))
+
+
+def planificar_carga(camiones, cajas, dimensiones=DIMENSIONES_CAMION):
+    return PlanificadorCarga(camiones, dimensiones).planificar(cajas)
+
+
+# Benchmark: 100.000 cajas en 1.000 camiones
+if __name__ == "__main__":
+    import sys
+    import time
+    import random
+    from CamionesYCajas import camion, Caja
+
+    n_camiones = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    n_cajas = int(sys.argv[2]) if len(sys.argv) > 2 else 100000
+
+    rng = random.Random(0)
+    camiones = [camion(f"C{i:04d}", "Conductor", 40000, "", 1 + i % 359) for i in range(n_camiones)]
+    cajas = [Caja(f"K{i}", rng.uniform(5, 100), "", rng.choice((40, 60, 80, 120)),
+                  rng.choice((30, 40, 60, 80)), rng.choice((30, 50, 70, 100)))
+             for i in range(n_cajas)]
+
+    inicio = time.perf_counter()
+    plan = planificar_carga(camiones, cajas)
+    segundos = time.perf_counter() - inicio
+
+    L, W, H = DIMENSIONES_CAMION
+    usados = [c for c in camiones if plan.colocaciones[c.matricula]]
+    ocupado = sum(p.largo * p.ancho * p.altura for lista in plan.colocaciones.values() for p in lista)
+    peso = sum(plan.peso(c) for c in usados)
+
+    print(f"{n_cajas} cajas, {n_camiones} camiones: {segundos:.2f} s ({n_cajas / segundos:,.0f} cajas/s)")
+    print(f"colocadas {plan.colocadas()} | sin asignar {len(plan.sin_asignar)} | camiones usados {len(usados)}")
+    if usados:
+        print(f"ocupación media: volumen {ocupado / (len(usados) * L * W * H):.1%} | "
+              f"peso {peso / sum(c.capacidad_kg for c in usados):.1%}")
+
+    inicio = time.perf_counter()
+    plan.comprobar()
+    print(f"plan comprobado (sin solapes ni sobrepeso) en {time.perf_counter() - inicio:.2f} s")
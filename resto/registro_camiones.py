@@ -0,0 +1,54 @@
+import time
+
+
+# =========================================================
+# RegistroCamiones: un único diccionario matrícula -> EntradaCamion
+# - Sustituye a la lista `camiones` y a los diccionarios paralelos
+#   `rectangulos`, `textos` y `posiciones` de CamionesYCajas_2.
+# - Buscar, comprobar y eliminar por matrícula es O(1).
+# - Detecta matrículas repetidas (o vacías) al dar de alta.
+# - Se recorre en orden de alta (los dict conservan el orden).
+# =========================================================
+class EntradaCamion:
+    def __init__(self, camion, x=50, y=50):
+        self.camion = camion
+        self.rect = None            # id del rectángulo en el canvas (se crea al verlo de cerca)
+        self.texto = None           # id del texto en el canvas
+        self.pos = [x, y]           # esquina superior izquierda, en coordenadas del mundo
+        self.visible = False        # True si sus items se ven (ver visibles en CamionesYCajas_2)
+        self.creado = time.time()
+
+
+class RegistroCamiones:
+    def __init__(self):
+        self.entradas = {}
+
+    def __len__(self):
+        return len(self.entradas)
+
+    def __contains__(self, matricula):
+        return matricula in self.entradas
+
+    def __iter__(self):
+        return iter(self.entradas.values())
+
+    def agregar(self, camion, x=50, y=50):
+        matricula = camion.matricula
+        if not matricula:
+            raise ValueError("La matrícula no puede estar vacía")
+        if matricula in self.entradas:
+            raise ValueError(f"Ya existe un camión con matrícula {matricula}")
+
+        entrada = EntradaCamion(camion, x, y)
+        self.entradas[matricula] = entrada
+        return entrada
+
+    def obtener(self, matricula):
+        # None si no existe
+        return self.entradas.get(matricula)
+
+    def eliminar(self, matricula):
+        return self.entradas.pop(matricula)
+
+    def matriculas(self):
+        return list(self.entradas)
@@ -0,0 +1,61 @@
+import time
+
+
+# =========================================================
+# RelojSimulacion: separa simulación y dibujado en los bucles de Tk
+# - La simulación avanza a pasos fijos de `paso_ms`, según el tiempo
+#   real transcurrido (no según cuándo le da la gana a Tk llamar a after).
+# - El reloj se despierta cada `dibujo_ms` y dibuja una vez por llamada,
+#   aunque en ella se hayan simulado varios pasos, y solo si ha simulado
+#   alguno (sin pasos el estado no ha cambiado). Así que se dibuja como
+#   mucho a la frecuencia de la simulación; por defecto dibujo_ms =
+#   paso_ms (despertarse más a menudo solo serviría para no dibujar).
+# - Como mucho `max_pasos` pasos por llamada: si la interfaz va muy
+#   cargada se dibujan menos frames, pero la simulación mantiene su
+#   velocidad (salvo retrasos enormes, que se descartan).
+# =========================================================
+class RelojSimulacion:
+    def __init__(self, widget, simular, dibujar, paso_ms=50, dibujo_ms=None, max_pasos=5):
+        self.widget = widget        # cualquier widget de Tk (para after)
+        self.simular = simular      # simular(): avanza un paso fijo
+        self.dibujar = dibujar      # dibujar(): refleja el estado en pantalla
+        self.paso_ms = paso_ms
+        self.dibujo_ms = paso_ms if dibujo_ms is None else dibujo_ms
+        self.max_pasos = max_pasos
+
+        self.acumulado = 0.0
+        self.ultimo = None
+        self.activo = False
+
+    def iniciar(self):
+        self.activo = True
+        self.ultimo = time.perf_counter()
+        self.acumulado = 0.0
+        self.widget.after(self.dibujo_ms, self.tick)
+
+    def parar(self):
+        self.activo = False
+
+    def tick(self):
+        if not self.activo:
+            return
+
+        ahora = time.perf_counter()
+        self.acumulado += (ahora - self.ultimo) * 1000
+        self.ultimo = ahora
+
+        pasos = 0
+        while self.acumulado >= self.paso_ms and pasos < self.max_pasos:
+            self.simular()
+            self.acumulado -= self.paso_ms
+            pasos += 1
+        if self.acumulado >= self.paso_ms:
+            # Aún quedan pasos tras max_pasos: retraso enorme, se descarta
+            self.acumulado = 0.0
+
+        if pasos:
+            self.dibujar()
+
+        # Lo que tardamos aquí se descuenta de la espera hasta el siguiente frame
+        gastado = int((time.perf_counter() - ahora) * 1000)
+        self.widget.after(max(1, self.dibujo_ms - gastado), self.tick)
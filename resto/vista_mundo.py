@@ -0,0 +1,97 @@
+# =========================================================
+# VistaMundo: paso de coordenadas del mundo a la pantalla (zoom + pan)
+# - Los camiones se mueven en un mundo de ancho x alto unidades; el
+#   canvas solo enseña la parte que cae en la vista.
+# - escala = píxeles por unidad del mundo; (x0, y0) = punto del mundo
+#   que queda en la esquina superior izquierda del canvas.
+# - Por debajo de `escala_detalle` no se dibuja cada camión: se agrupan
+#   en celdas de `celda_px` píxeles y se pinta un marcador por celda.
+#   La rejilla de celdas está fija en el mundo (no en la vista), para que
+#   los grupos no salten al arrastrar.
+# =========================================================
+class VistaMundo:
+    def __init__(self, ancho_mundo, alto_mundo, ancho_px, alto_px, escala_detalle=0.5, escala_max=4.0):
+        self.ancho_mundo = ancho_mundo
+        self.alto_mundo = alto_mundo
+        self.ancho_px = ancho_px
+        self.alto_px = alto_px
+        self.escala_detalle = escala_detalle
+        self.escala_max = escala_max
+
+        self.escala = 1.0
+        self.x0 = 0.0
+        self.y0 = 0.0
+
+    @property
+    def escala_min(self):
+        # Con el zoom mínimo cabe el mundo entero
+        return min(self.ancho_px / self.ancho_mundo, self.alto_px / self.alto_mundo)
+
+    @property
+    def detalle(self):
+        return self.escala >= self.escala_detalle
+
+    def a_pantalla(self, x, y):
+        return (x - self.x0) * self.escala, (y - self.y0) * self.escala
+
+    def a_mundo(self, px, py):
+        return self.x0 + px / self.escala, self.y0 + py / self.escala
+
+    def rect_mundo(self):
+        # Zona del mundo visible: (x0, y0, x1, y1)
+        return (self.x0, self.y0,
+                self.x0 + self.ancho_px / self.escala, self.y0 + self.alto_px / self.escala)
+
+    def redimensionar(self, ancho_px, alto_px):
+        self.ancho_px = ancho_px
+        self.alto_px = alto_px
+        self.limitar()
+
+    def zoom(self, factor, px, py):
+        # El punto del mundo bajo el ratón (px, py) se queda donde está
+        mx, my = self.a_mundo(px, py)
+        self.escala = max(self.escala_min, min(self.escala_max, self.escala * factor))
+        self.x0 = mx - px / self.escala
+        self.y0 = my - py / self.escala
+        self.limitar()
+
+    def desplazar(self, dx_px, dy_px):
+        self.x0 -= dx_px / self.escala
+        self.y0 -= dy_px / self.escala
+        self.limitar()
+
+    def limitar(self):
+        # No dejar que la vista se salga del mundo (si el mundo cabe, centrado)
+        ancho = self.ancho_px / self.escala
+        alto = self.alto_px / self.escala
+        if ancho >= self.ancho_mundo:
+            self.x0 = (self.ancho_mundo - ancho) / 2
+        else:
+            self.x0 = max(0.0, min(self.ancho_mundo - ancho, self.x0))
+        if alto >= self.alto_mundo:
+            self.y0 = (self.alto_mundo - alto) / 2
+        else:
+            self.y0 = max(0.0, min(self.alto_mundo - alto, self.y0))
+
+    def agrupar(self, posiciones, celda_px=40):
+        # posiciones: iterable de (x, y) del mundo.
+        # Devuelve [(cx, cy, n)]: centro medio en pantalla y cuántos hay por celda.
+        x0, y0, x1, y1 = self.rect_mundo()
+        celda = celda_px / self.escala
+        celdas = {}
+        for x, y in posiciones:
+            if x0 <= x < x1 and y0 <= y < y1:
+                clave = (int(x // celda), int(y // celda))
+                suma = celdas.get(clave)
+                if suma is None:
+                    celdas[clave] = [x, y, 1]
+                else:
+                    suma[0] += x
+                    suma[1] += y
+                    suma[2] += 1
+
+        grupos = []
+        for sx, sy, n in celdas.values():
+            px, py = self.a_pantalla(sx / n, sy / n)
+            grupos.append((px, py, n))
+        return grupos